@@ -5,16 +5,42 @@ This module provides the main FastAPI application with CORS middleware
 and basic endpoints for the CRM sales opportunities system.
 """
 
+import time
+
+# Measure how long it takes to import this module (dependencies included).
+_IMPORT_STARTED = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import gzip
 import os
+import threading
+from contextlib import asynccontextmanager
 from pickle import load
 from datetime import datetime
-from fastapi import FastAPI, Request
-import pandas as pd
+import brotli
+import orjson
+from fastapi import FastAPI, Request, Response
+
+from api.runtime import load_runtime_model, EXPORT_FILE, SAVING_FILE
+# pylint: enable=wrong-import-position
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MODELS_PATH = os.path.join(PROJECT_ROOT, "models")
+MODEL_FILES = ("model.pkl", "preprocessor.pkl", "metadata.pkl")
+
+# Seconds between two scans of MODELS_PATH (0 disables hot reload).
+MODEL_POLL_INTERVAL = float(os.getenv("MODEL_POLL_INTERVAL", "5"))
 
-app = FastAPI()
+# Responses smaller than this (in bytes) are not worth compressing.
+COMPRESS_MIN_SIZE = 1024
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Startup timings, in seconds, reported by the health endpoint.
+TIMINGS = {
+    "import_seconds": None,
+    "load_seconds": {},
+    "first_request_seconds": None,
+}
 
 
 ###############################################################################
@@ -22,38 +48,280 @@ app = FastAPI()
 ###############################################################################
 
 
-def get_model_folder_path(version: str):
-    # Load model from versioned folder (ex: ../models/v1).
-    if version != 'dev':
-        return os.path.join(MODELS_PATH, version)
+def load_model(model_folder_path: str):
+    """
+    Load a model and its metadata from a given folder.
+
+    Exported models (model.npz) only need NumPy, pickled ones are the
+    fallback and import pandas and sklearn.
+    """
+    model = load_runtime_model(model_folder_path)
+    with open(os.path.join(model_folder_path, "metadata.pkl"), "rb") as f:
+        metadata = load(f)
+
+    return model, metadata
 
-    # Get latest trained model by default, for development purpose.
-    model_dirs = [d for d in os.listdir(MODELS_PATH)
-                  if os.path.isdir(os.path.join(MODELS_PATH, d))]
 
-    model_dirs.sort(reverse=True)
-    latest_model_dir = model_dirs[0]
-    return os.path.join(MODELS_PATH, latest_model_dir)
+def _is_dev_name(name: str) -> bool:
+    """True for dev-<timestamp> folders, as saved by src.model."""
+    return name.startswith("dev-") and name[4:].isdigit()
 
 
-def load_model(version: str):
+def make_predictions(model, metadata, kwargs: dict) -> dict:
     """
-    Load the most recent model from MODELS_PATH.
+    Predict a score for each sales agent, or the requested one only.
 
-    Params:
-        latest: If False, get latest model by folders name.
+    Returns:
+        dict: A dictionary of prediction, keyed by sale_agent.
     """
-    model_folder_path = get_model_folder_path(version)
+    # Default features required for prediction
+    all_agents = metadata['feature_categories']['sales_agent']
+    features = metadata['feature_defaults']
 
-    # Load the model components
-    with open(os.path.join(model_folder_path, "model.pkl"), "rb") as f:
-        model = load(f)
-    with open(os.path.join(model_folder_path, "preprocessor.pkl"), "rb") as f:
-        preprocessor = load(f)
-    with open(os.path.join(model_folder_path, "metadata.pkl"), "rb") as f:
-        metadata = load(f)
+    # If sales_agent is specified, only predict for that agent
+    if 'sales_agent' in kwargs and kwargs['sales_agent'] is not None:
+        all_agents = [kwargs['sales_agent']]
+
+    # One row of features per agent, updated with any provided kwargs.
+    records = []
+    for sales_agent in all_agents:
+        agent_features = features.copy()
+        agent_features['sales_agent'] = sales_agent
+
+        for key, value in kwargs.items():
+            if key != 'sales_agent' and value is not None:
+                agent_features[key] = value
+
+        records.append(agent_features)
+
+    # Predict all agents at once
+    scores = model.predict_records(records)
+    return {sales_agent: float(score) for sales_agent, score in zip(all_agents, scores)}
 
-    return model, preprocessor, metadata
+
+class ModelRegistry:
+    """
+    Keep model versions in memory and reload them when their files change.
+
+    Named versions (ex: v1) and the newest dev-<timestamp> folder are loaded
+    at startup. Other folders, such as older dev models, are loaded on
+    demand by get() and then kept up to date too.
+
+    A background thread polls MODELS_PATH, loads and warms new or changed
+    folders, then swaps them in. Requests only do dictionary lookups, and
+    in-flight requests keep a reference to the model they started with.
+    """
+
+    def __init__(self, models_path: str, poll_interval: float):
+        self.models_path = models_path
+        self.poll_interval = poll_interval
+        self._models = {}
+        self._signatures = {}
+        self._pending = {}
+        self._failed = {}
+        self._requested = set()
+        self._latest_dev = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _signature(self, name: str):
+        """Size and modification time of model files, None if incomplete."""
+        folder = os.path.join(self.models_path, name)
+        if os.path.exists(os.path.join(folder, SAVING_FILE)):
+            return None
+        try:
+            stats = [os.stat(os.path.join(folder, file)) for file in MODEL_FILES]
+        except OSError:
+            return None
+        export_path = os.path.join(folder, EXPORT_FILE)
+        if os.path.exists(export_path):
+            stats.append(os.stat(export_path))
+        return tuple((stat.st_mtime_ns, stat.st_size) for stat in stats)
+
+    def _load(self, name: str, signature):
+        """Load and warm a model folder, then swap it in."""
+        started = time.perf_counter()
+        loaded = load_model(os.path.join(self.models_path, name))
+        if self._signature(name) != signature:
+            raise RuntimeError("files changed while loading")
+        TIMINGS["load_seconds"][name] = time.perf_counter() - started
+        make_predictions(*loaded, {'sales_agent': None})
+        self._models[name] = loaded
+        self._signatures[name] = signature
+
+    def _refresh_folder(self, name: str, signature, debounce: bool = False):
+        """(Re)load a model folder if its files changed since the last attempt."""
+        if signature is None or signature in (
+                self._signatures.get(name), self._failed.get(name)):
+            return
+        if debounce and self._pending.get(name) != signature:
+            self._pending[name] = signature
+            return
+        self._pending.pop(name, None)
+        try:
+            self._load(name, signature)
+            self._failed.pop(name, None)
+            print(f"🔄 Model loaded: {name}")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Retried only once its files change.
+            self._failed[name] = signature
+            print(f"⚠️ Model not loaded: {name} ({e})")
+
+    def refresh(self, debounce: bool = False):
+        """
+        Scan MODELS_PATH once and (re)load changed model folders.
+
+        Folders being saved by src.model are skipped until saved entirely,
+        see SAVING_FILE.
+
+        Params:
+            debounce: If True, also wait for files to be unchanged between
+                two scans before loading them, for folders copied by other
+                means.
+        """
+        with self._lock:
+            names = {d for d in os.listdir(self.models_path)
+                     if os.path.isdir(os.path.join(self.models_path, d))}
+            signatures = {name: self._signature(name) for name in names}
+
+            # Latest trained model by timestamp, for development purpose.
+            # Other names (ex: dev-old) are only loaded on demand.
+            dev_names = [name for name in names
+                         if _is_dev_name(name) and signatures[name] is not None]
+            newest_dev = max(dev_names, key=lambda name: int(name[4:]), default=None)
+
+            # Keep the current dev model until the newest one is loaded.
+            watched = {name for name in names if not name.startswith("dev-")}
+            watched |= self._requested | {newest_dev, self._latest_dev}
+            watched &= names
+
+            for name in sorted(watched):
+                self._refresh_folder(name, signatures[name], debounce)
+
+            previous_dev = self._latest_dev
+            self._latest_dev = max(
+                (name for name in self._models if name in watched and _is_dev_name(name)),
+                key=lambda name: int(name[4:]), default=None)
+
+            # Drop the previous dev model once replaced, unless requested.
+            if previous_dev != self._latest_dev and previous_dev not in self._requested:
+                watched.discard(previous_dev)
+            for name in set(self._models) - watched:
+                del self._models[name]
+                del self._signatures[name]
+            for state in (self._pending, self._failed):
+                for name in set(state) - names:
+                    del state[name]
+            self._requested &= names
+
+    def get(self, version: str):
+        """Get the loaded model and metadata of a version."""
+        name = self._latest_dev if version == 'dev' else version
+        loaded = self._models.get(name)
+        if loaded is None and self._thread is None:
+            # Hot reload is disabled, scan again now.
+            self.refresh()
+            name = self._latest_dev if version == 'dev' else version
+            loaded = self._models.get(name)
+        if loaded is None and version != 'dev' and version in os.listdir(self.models_path):
+            # Not loaded at startup (ex: an older dev model), load it now.
+            with self._lock:
+                self._requested.add(version)
+                self._refresh_folder(version, self._signature(version))
+            loaded = self._models.get(version)
+        if loaded is None:
+            raise FileNotFoundError(f"Model not found: {version}")
+        return loaded
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh(debounce=True)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Keep watching, the next scan may succeed.
+                print(f"⚠️ Cannot scan models: {e}")
+
+    def start(self):
+        """Load named versions and the newest dev model, then watch for changes."""
+        self.refresh()
+        if self.poll_interval > 0:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+registry = ModelRegistry(MODELS_PATH, MODEL_POLL_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    registry.start()
+    print(f"⏱️ Import: {TIMINGS['import_seconds']:.3f}s, "
+          f"models: {sum(TIMINGS['load_seconds'].values()):.3f}s")
+    yield
+    registry.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.middleware("http")
+async def time_first_request(request: Request, call_next):
+    """Measure the duration of the very first request."""
+    if TIMINGS["first_request_seconds"] is not None:
+        return await call_next(request)
+
+    started = time.perf_counter()
+    response = await call_next(request)
+    TIMINGS["first_request_seconds"] = time.perf_counter() - started
+    return response
+
+
+def _json_default(obj):
+    """Serialize objects orjson does not support natively (ex: pandas)."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError
+
+
+def _accepted_encodings(request: Request) -> set:
+    """Parse the Accept-Encoding header, ignoring encodings with q=0."""
+    encodings = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        encodings.add(name.strip().lower())
+    return encodings
+
+
+def json_response(request: Request, content) -> Response:
+    """
+    Serialize content with orjson, then compress it with brotli or gzip
+    when the client accepts it and the payload is large enough.
+    """
+    body = orjson.dumps(content, default=_json_default, option=JSON_OPTIONS)
+    headers = {"Vary": "Accept-Encoding"}
+
+    if len(body) >= COMPRESS_MIN_SIZE:
+        encodings = _accepted_encodings(request)
+        if "br" in encodings:
+            body = brotli.compress(body, quality=4)
+            headers["Content-Encoding"] = "br"
+        elif "gzip" in encodings:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 ###############################################################################
 # Routes
@@ -79,22 +347,23 @@ def health():
     Helper endpoint to check service.
 
     Returns:
-        dict: A dictionary containing a timestamp.
+        dict: A dictionary containing a timestamp and startup timings.
     """
     return {
         "timestamp": datetime.now(),
+        "timings": TIMINGS,
     }
 
 
 @app.get("/{version}/info")
-def info(version: str):
+def info(version: str, request: Request):
     """
     Root endpoint that returns information about the model.
 
     Returns:
         dict: A dictionary containing info about the latest model.
     """
-    _, _, metadata = load_model(version)
+    _, metadata = registry.get(version)
 
     model_type = metadata["model_type"]
     test_score = metadata["test_score"]
@@ -105,7 +374,7 @@ def info(version: str):
     for k,v in metadata['feature_categories'].items():
         feature_categories[k] = [str(item) for item in v if item is not None and str(item) != 'nan']
 
-    return {
+    return json_response(request, {
         "model_type": model_type,
         'test_score': {
             "summary": f"{test_score.mean():.4f} (+/- {test_score.std() * 2:.4f})",
@@ -117,7 +386,7 @@ def info(version: str):
             "defaults": feature_defaults,
             "categories": feature_categories
         }
-    }
+    })
 
 
 @app.get("/{version}/predict")
@@ -125,47 +394,32 @@ def predict(version: str, request: Request):
     """
     Root endpoint that returns a prediction from our model.
 
+    Use format=columnar to get parallel arrays of agents and scores.
+
     Returns:
         dict: A dictionary of prediction, keyed by sale_agent.
     """
-    model, preprocessor, metadata = load_model(version)
-
-    # Default features required for prediction
-    all_agents = metadata['feature_categories']['sales_agent']
-    features = metadata['feature_defaults']
+    model, metadata = registry.get(version)
 
     # Get all query parameters from the request
     kwargs = dict(request.query_params)
+    output_format = kwargs.pop('format', None)
 
-    # If sales_agent is specified, only predict for that agent
-    if 'sales_agent' in kwargs and kwargs['sales_agent'] is not None:
-        all_agents = [kwargs['sales_agent']]
+    predictions = make_predictions(model, metadata, kwargs)
 
-    # Make predictions
-    predictions = {}
-    for sales_agent in all_agents:
-        agent_features = features.copy()
-        agent_features['sales_agent'] = sales_agent
+    if output_format == 'columnar':
+        return json_response(request, {
+            "sales_agent": list(predictions.keys()),
+            "score": list(predictions.values()),
+        })
 
-        # Update features with any provided kwargs.
-        for key, value in kwargs.items():
-            if key != 'sales_agent' and value is not None:
-                agent_features[key] = value
-
-        # Convert dictionary to DataFrame (required by preprocessor)
-        features_df = pd.DataFrame([agent_features])
+    return json_response(request, predictions)
 
-        # Transform features using the trained preprocessor
-        X_transformed = preprocessor.transform(features_df)
 
-        # Predict now
-        prediction = float(model.predict(X_transformed)[0])
-        predictions[sales_agent] = prediction
-
-    return predictions
+@app.get("/{version}/feature-importances")
+def feature_importance(version: str, request: Request):
+    _, metadata = registry.get(version)
+    return json_response(request, metadata['feature_importances'])
 
 
-@app.get("/{version}/feature-importances")
-def feature_importance(version: str):
-    _, _, metadata = load_model(version)
-    return metadata['feature_importances']
+TIMINGS["import_seconds"] = time.perf_counter() - _IMPORT_STARTED
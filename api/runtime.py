@@ -0,0 +1,145 @@
+"""
+Inference-only runtime for the AISRM API.
+
+This module predicts from models exported by src/export.py (model.npz),
+using NumPy only. Pickled models are still supported as a fallback, in
+which case pandas and sklearn are imported on first use.
+"""
+
+import json
+import math
+import os
+from pickle import load
+
+import numpy as np
+
+EXPORT_FILE = "model.npz"
+EXPORT_FORMAT = 1
+
+# Present in a model folder while it is being saved, see src.model.save_model().
+SAVING_FILE = ".saving"
+
+
+def _to_float(value) -> float:
+    """Numeric feature value, NaN when missing or not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _to_category(value):
+    """Categorical feature value, None when missing (None, NaN or pandas.NA)."""
+    if (value is None or (isinstance(value, float) and math.isnan(value))
+            or type(value).__name__ == "NAType"):
+        return None
+    return str(value)
+
+
+class NumpyModel:
+    """Preprocessor and model exported as NumPy arrays."""
+
+    def __init__(self, file_path: str):
+        with np.load(file_path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+
+        spec = json.loads(str(arrays.pop("spec")))
+        if spec["format"] != EXPORT_FORMAT:
+            raise ValueError(f"Unsupported export format: {spec['format']}")
+
+        self.features_out = spec["features_out"]
+        self.blocks = spec["blocks"]
+        self.estimator = spec["estimator"]
+        self.arrays = arrays
+
+        # Position of each category, per categorical column.
+        for block in self.blocks:
+            if block["type"] == "cat":
+                block["index"] = [
+                    {value: i for i, value in enumerate(categories)}
+                    for categories in block["categories"]
+                ]
+
+    def transform(self, records: list) -> np.ndarray:
+        """Same output as the exported ColumnTransformer, for a list of dicts."""
+        X = np.zeros((len(records), self.features_out))
+        rows = np.arange(len(records))
+
+        for block in self.blocks:
+            start = block["start"]
+            if block["type"] == "num":
+                key = block["key"]
+                values = np.array(
+                    [[_to_float(record.get(col)) for col in block["columns"]]
+                     for record in records],
+                    dtype=float,
+                ).reshape(len(records), len(block["columns"]))
+                values = np.where(np.isnan(values), self.arrays[f"{key}_statistics"], values)
+                X[:, start:start + values.shape[1]] = (
+                    values - self.arrays[f"{key}_center"]) / self.arrays[f"{key}_scale"]
+                continue
+
+            for col, categories, index in zip(
+                    block["columns"], block["categories"], block["index"]):
+                codes = np.array([
+                    index.get(_to_category(record.get(col)), -1) for record in records
+                ], dtype=np.int64)
+                if (codes < 0).any() and block["handle_unknown"] == "error":
+                    raise ValueError(f"Found unknown categories in column {col}")
+                known = codes >= 0
+                X[rows[known], start + codes[known]] = 1.0
+                start += len(categories)
+
+        return X
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        if self.estimator["type"] == "linear":
+            return X @ self.arrays["coef"] + self.estimator["intercept"]
+
+        # Walk all trees at once, one level per iteration.
+        # Trees are fitted on float32 inputs, compare the same way as sklearn.
+        X = X.astype(np.float32)
+        left = self.arrays["tree_children_left"]
+        right = self.arrays["tree_children_right"]
+        feature = self.arrays["tree_feature"]
+        threshold = self.arrays["tree_threshold"]
+        nodes = np.broadcast_to(self.arrays["tree_roots"], (len(X), len(self.arrays["tree_roots"])))
+        rows = np.arange(len(X))[:, None]
+        for _ in range(self.estimator["max_depth"]):
+            is_leaf = left[nodes] < 0
+            go_left = X[rows, np.where(is_leaf, 0, feature[nodes])] <= threshold[nodes]
+            nodes = np.where(is_leaf, nodes, np.where(go_left, left[nodes], right[nodes]))
+
+        values = self.arrays["tree_value"][nodes].sum(axis=1)
+        return self.estimator["init"] + self.estimator["learning_rate"] * values
+
+    def predict_records(self, records: list) -> np.ndarray:
+        return self.predict(self.transform(records))
+
+
+class PickleModel:
+    """Legacy pickled preprocessor and model, which require pandas and sklearn."""
+
+    def __init__(self, model_folder_path: str):
+        with open(os.path.join(model_folder_path, "model.pkl"), "rb") as f:
+            self.model = load(f)
+        with open(os.path.join(model_folder_path, "preprocessor.pkl"), "rb") as f:
+            self.preprocessor = load(f)
+
+    def predict_records(self, records: list) -> np.ndarray:
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        # Convert records to DataFrame (required by preprocessor)
+        features_df = pd.DataFrame(records)
+        X_transformed = self.preprocessor.transform(features_df)
+        return self.model.predict(X_transformed)
+
+
+def load_runtime_model(model_folder_path: str):
+    """
+    Load the exported model of a folder, or its pickles when not exported.
+    """
+    file_path = os.path.join(model_folder_path, EXPORT_FILE)
+    if os.path.exists(file_path):
+        return NumpyModel(file_path)
+    return PickleModel(model_folder_path)
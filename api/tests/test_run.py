@@ -0,0 +1,230 @@
+# pylint: disable-all
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pickle import dump
+from unittest import mock
+
+import brotli
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import api.run
+from api.run import ModelRegistry, json_response, COMPRESS_MIN_SIZE
+from api.runtime import EXPORT_FILE, EXPORT_FORMAT, SAVING_FILE
+
+
+def write_model(folder: str, agents: list, intercept: float = 0.0):
+    """Save a tiny exported linear model, one coefficient per agent."""
+    os.makedirs(folder, exist_ok=True)
+    spec = {
+        "format": EXPORT_FORMAT,
+        "features_out": len(agents),
+        "blocks": [{"type": "cat", "columns": ["sales_agent"], "start": 0,
+                    "categories": [agents], "handle_unknown": "ignore"}],
+        "estimator": {"type": "linear", "intercept": intercept},
+    }
+    np.savez(os.path.join(folder, EXPORT_FILE), spec=np.array(json.dumps(spec)),
+             coef=np.arange(len(agents), dtype=float))
+
+    metadata = {
+        "model_type": "SGDRegressor",
+        "test_score": np.array([0.5, 0.5]),
+        "features_out": len(agents),
+        "feature_importances": None,
+        "feature_defaults": {"sales_agent": agents[0]},
+        "feature_categories": {"sales_agent": np.asarray(agents, dtype=object)},
+    }
+    for name, obj in [("model", None), ("preprocessor", None), ("metadata", metadata)]:
+        with open(os.path.join(folder, f"{name}.pkl"), "wb") as f:
+            dump(obj, f)
+
+    # Files rewritten within the same tick must still look changed.
+    for file in os.listdir(folder):
+        file_path = os.path.join(folder, file)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + int(intercept * 1e9)))
+
+
+stub = FastAPI()
+
+
+@stub.get("/payload")
+def payload(request: Request, size: int):
+    return json_response(request, {"data": "x" * size})
+
+
+class TestJsonResponse(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(stub)
+
+    def get(self, size, accept_encoding):
+        # The test client decodes responses, read the raw bytes instead.
+        with self.client.stream("GET", f"/payload?size={size}",
+                                headers={"Accept-Encoding": accept_encoding}) as response:
+            return response, b"".join(response.iter_raw())
+
+    def test_brotli_preferred(self):
+        response, body = self.get(5000, "gzip, deflate, br")
+        self.assertEqual(response.headers["content-encoding"], "br")
+        self.assertEqual(json.loads(brotli.decompress(body)), {"data": "x" * 5000})
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+
+    def test_gzip(self):
+        response, body = self.get(5000, "gzip, br;q=0")
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(body)), {"data": "x" * 5000})
+
+    def test_not_accepted(self):
+        response, body = self.get(5000, "br;q=0, gzip;q=0.0")
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(json.loads(body), {"data": "x" * 5000})
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+
+    def test_small_payload(self):
+        response, body = self.get(COMPRESS_MIN_SIZE // 2, "br, gzip")
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(json.loads(body), {"data": "x" * (COMPRESS_MIN_SIZE // 2)})
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+
+
+class TestPredict(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.agents = ["anna", "bob", "cy"]
+        write_model(os.path.join(self.tmp.name, "v1"), self.agents, intercept=10.0)
+        registry = ModelRegistry(self.tmp.name, 0)
+        patcher = mock.patch.object(api.run, "registry", registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(api.run.app)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_predict(self):
+        response = self.client.get("/v1/predict")
+        self.assertEqual(response.json(), {"anna": 10.0, "bob": 11.0, "cy": 12.0})
+
+    def test_predict_columnar(self):
+        response = self.client.get("/v1/predict?format=columnar")
+        self.assertEqual(response.json(), {
+            "sales_agent": self.agents,
+            "score": [10.0, 11.0, 12.0],
+        })
+
+        response = self.client.get("/v1/predict?format=columnar&sales_agent=bob")
+        self.assertEqual(response.json(), {"sales_agent": ["bob"], "score": [11.0]})
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.models_path = self.tmp.name
+        self.agents = ["anna", "bob"]
+        self.registry = ModelRegistry(self.models_path, 0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, intercept=0.0):
+        write_model(os.path.join(self.models_path, name), self.agents, intercept)
+
+    def score(self, version):
+        model, metadata = self.registry.get(version)
+        return api.run.make_predictions(model, metadata, {"sales_agent": "anna"})["anna"]
+
+    def test_startup(self):
+        self.write("v1", 1.0)
+        self.write("dev-100", 2.0)
+        self.write("dev-200", 3.0)
+        self.write("dev-old", 4.0)
+        self.registry.refresh()
+
+        # Named versions and the newest dev model only.
+        self.assertEqual(sorted(self.registry._models), ["dev-200", "v1"])
+        self.assertEqual(self.score("dev"), 3.0)
+
+        # Other folders on demand.
+        self.assertEqual(self.score("dev-100"), 2.0)
+        self.assertEqual(self.score("dev-old"), 4.0)
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get("v9")
+
+    def test_new_dev_model(self):
+        self.write("dev-100", 1.0)
+        self.registry.refresh()
+        self.write("dev-200", 2.0)
+
+        # The previous dev model is kept until the new one is loaded.
+        self.registry.refresh(debounce=True)
+        self.assertEqual(self.score("dev"), 1.0)
+        self.registry.refresh(debounce=True)
+        self.assertEqual(self.score("dev"), 2.0)
+        self.assertNotIn("dev-100", self.registry._models)
+
+    def test_debounce(self):
+        self.write("v1", 1.0)
+        self.registry.refresh()
+        self.write("v1", 2.0)
+
+        # Files must be unchanged between two scans.
+        self.registry.refresh(debounce=True)
+        self.assertEqual(self.score("v1"), 1.0)
+        self.registry.refresh(debounce=True)
+        self.assertEqual(self.score("v1"), 2.0)
+
+    def test_saving(self):
+        self.write("v1", 1.0)
+        self.registry.refresh()
+        self.write("v1", 2.0)
+        open(os.path.join(self.models_path, "v1", SAVING_FILE), "w").close()
+
+        self.registry.refresh()
+        self.assertEqual(self.score("v1"), 1.0)
+
+        os.remove(os.path.join(self.models_path, "v1", SAVING_FILE))
+        self.registry.refresh()
+        self.assertEqual(self.score("v1"), 2.0)
+
+    def test_failed(self):
+        self.write("v1", 1.0)
+        with open(os.path.join(self.models_path, "v1", "metadata.pkl"), "wb") as f:
+            f.write(b"not a pickle")
+
+        with mock.patch("api.run.load_model", wraps=api.run.load_model) as load_model:
+            self.registry.refresh()
+            self.registry.refresh()
+            self.assertEqual(load_model.call_count, 1)
+
+            # Retried once its files change.
+            self.write("v1", 2.0)
+            self.registry.refresh()
+            self.assertEqual(load_model.call_count, 2)
+        self.assertEqual(self.score("v1"), 2.0)
+
+    def test_removed(self):
+        self.write("v1", 1.0)
+        self.registry.refresh()
+        shutil.rmtree(os.path.join(self.models_path, "v1"))
+
+        self.registry.refresh()
+        self.assertNotIn("v1", self.registry._models)
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get("v1")
+
+    def test_polling_disabled(self):
+        self.registry.start()
+        self.addCleanup(self.registry.stop)
+        self.assertIsNone(self.registry._thread)
+
+        # New folders are found by get() itself.
+        self.write("v2", 5.0)
+        self.write("dev-300", 6.0)
+        self.assertEqual(self.score("v2"), 5.0)
+        self.assertEqual(self.score("dev"), 6.0)
@@ -5,6 +5,7 @@ Streamlit application for AISRM CRM Sales Opportunities frontend.
 import os
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -16,8 +17,64 @@ API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:8500')
 DEFAULT_VERSION = "v2"
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MODELS_PATH = os.path.join(PROJECT_ROOT, "models")
-VERSIONS = [dir for dir in os.listdir(
-    MODELS_PATH) if os.path.isdir(os.path.join(MODELS_PATH, dir))]
+CACHE_TTL = int(os.getenv('APP_CACHE_TTL', '300'))
+
+
+###############################################################################
+# Helpers
+###############################################################################
+
+
+@st.cache_resource
+def get_session():
+    """
+    Shared HTTP session, so connections to the API are pooled across reruns.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def get_versions():
+    """List available model versions from disk."""
+    return [dir for dir in os.listdir(
+        MODELS_PATH) if os.path.isdir(os.path.join(MODELS_PATH, dir))]
+
+
+def api_get(path, params=None):
+    """
+    Query the API and return the decoded JSON.
+
+    Raises an HTTPError on failure, so that errors are never cached.
+    """
+    response = get_session().get(f"{API_BASE_URL}{path}", params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def get_info(version):
+    return api_get(f"/{version}/info")
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def get_feature_importances(version):
+    return api_get(f"/{version}/feature-importances")
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=1000)
+def get_predictions(version, feature_inputs):
+    """Predictions are memoized per version and input combination."""
+    return api_get(f"/{version}/predict", params=dict(feature_inputs))
+
+
+def show_http_error(message, error):
+    st.error(f"{message}: {error.response.status_code}")
+    st.error(f"Error: {error.response.text}")
+    st.error(f"Base URL: {API_BASE_URL}")
 
 
 # Add custom CSS styling
@@ -72,14 +129,12 @@ st.markdown('<div class="main-header"><h1>🎯 AISRM</h1><p>AI-powered Sales Age
 # Version selector
 st.markdown('<div class="section-header">🔧 Model Configuration</div>', unsafe_allow_html=True)
 version = st.selectbox("🤖 Model Version", sorted(
-    VERSIONS, reverse=True), index=0)
+    get_versions(), reverse=True), index=0)
 
 try:
     # Get model info and feature categories
-    info_response = requests.get(f"{API_BASE_URL}/{version}/info", timeout=10)
-    if info_response.status_code == 200:
-        model_info = info_response.json()
-
+    model_info = get_info(version)
+    if model_info:
         # Feature inputs
         st.markdown('<div class="section-header">🎯 Input Features</div>', unsafe_allow_html=True)
 
@@ -123,15 +178,14 @@ try:
         if st.button("🚀 Get Prediction", type="primary"):
             with st.spinner("🔄 Analyzing sales agents..."):
                 # Make prediction request
-                predict_response = requests.get(
-                    f"{API_BASE_URL}/{version}/predict",
-                    params=feature_inputs,
-                    timeout=10
-                )
-
-            if predict_response.status_code == 200:
-                predictions = predict_response.json()
-
+                try:
+                    predictions = get_predictions(
+                        version, tuple(sorted(feature_inputs.items())))
+                except requests.exceptions.HTTPError as e:
+                    predictions = None
+                    st.error(f"❌ Prediction failed: {e.response.status_code}")
+
+            if predictions is not None:
                 st.markdown('<div class="section-header">📊 Predictions</div>', unsafe_allow_html=True)
 
                 # Convert to DataFrame for better display
@@ -172,14 +226,9 @@ try:
                 st.markdown(prediction_text, unsafe_allow_html=True)
 
                 st.toast(f'Best recommendation: {best_agent["Sales Agent"]} with {best_score} expected close value!', icon='🎉')
-            else:
-                st.error(f"❌ Prediction failed: {predict_response.status_code}")
-
-    else:
-        st.error(f"Failed to load model info: {info_response.status_code}")
-        st.error(f"Error: {info_response.text}")
-        st.error(f"Base URL: {API_BASE_URL}")
 
+except requests.exceptions.HTTPError as e:
+    show_http_error("Failed to load model info", e)
 except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
     st.error(
         f"❌ Cannot connect to API server. Make sure the API is running on {API_BASE_URL}")
@@ -193,10 +242,8 @@ except Exception as e:
 # Feature importance visualization (optional)
 if st.checkbox("📊 Show Feature Importances"):
     try:
-        importance_response = requests.get(
-            f"{API_BASE_URL}/{version}/feature-importances", timeout=10)
-        if importance_response.status_code == 200:
-            importances = importance_response.json()
+        importances = get_feature_importances(version)
+        if importances:
             feature_names = list(importances['feature'].values())
             importance_values = list(importances['importance'].values())
 
@@ -214,10 +261,8 @@ if st.checkbox("📊 Show Feature Importances"):
 # Model information visualization (optional)
 if st.checkbox("📊 Show Model Information"):
     try:
-        info_response = requests.get(f"{API_BASE_URL}/{version}/info", timeout=10)
-        if info_response.status_code == 200:
-            model_info = info_response.json()
-
+        model_info = get_info(version)
+        if model_info:
             st.markdown('<div class="section-header">📊 Model Information</div>', unsafe_allow_html=True)
 
             # Create colored metrics
@@ -234,7 +279,7 @@ if st.checkbox("📊 Show Model Information"):
                     label="📈 Test Score",
                     value=model_info['test_score']['summary'],
                 )
-        else:
-            st.error(f"❌ Failed to load model info: {info_response.status_code}")
+    except requests.exceptions.HTTPError as e:
+        st.error(f"❌ Failed to load model info: {e.response.status_code}")
     except (requests.exceptions.RequestException, ValueError) as e:
         st.error(f"❌ Failed to load model information: {str(e)}")
@@ -11,3 +11,18 @@ PROCESSED_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "processed")
 MODELS_PATH = os.path.join(PROJECT_ROOT, "models")
 
 HOLD_OUT = 0.3
+
+# Early stopping: boosting stages added between two validations, number of
+# validations without improvement before stopping, and upper bound.
+VALIDATION_FRACTION = 0.1
+EARLY_STOPPING_STEP = 10
+EARLY_STOPPING_PATIENCE = 5
+EARLY_STOPPING_TOL = 1e-4
+MAX_ESTIMATORS = 2000
+CHECKPOINTS_PATH = os.path.join(PROJECT_ROOT, "checkpoints")
+
+# Out-of-core training: rows read at once, rows kept to fit the preprocessor,
+# and default memory budget for the training sample (in MB).
+TRAINING_CHUNK_SIZE = 100_000
+PROFILE_SIZE = 100_000
+TRAINING_MEMORY_BUDGET_MB = 1024
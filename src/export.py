@@ -0,0 +1,191 @@
+"""Model export module for the AISRM project.
+
+This module converts a trained preprocessor and model into plain NumPy
+arrays (model.npz), so that the API can predict without importing pandas
+or sklearn. See api/runtime.py for the reader of this format.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from api.runtime import EXPORT_FILE, EXPORT_FORMAT
+from src.storage import dump_atomic, get_model_folder_path, load_model, saving
+
+
+def _is_missing(value) -> bool:
+    """True for None, NaN and pandas.NA."""
+    return (value is None
+            or (isinstance(value, float) and np.isnan(value))
+            or type(value).__name__ == "NAType")
+
+
+def _steps(transformer) -> list:
+    """Estimators of a pipeline, or the transformer itself."""
+    if hasattr(transformer, "steps"):
+        return [step for _, step in transformer.steps]
+    return [transformer]
+
+
+def export_preprocessor(preprocessor, arrays: dict) -> list:
+    """
+    Export a ColumnTransformer made of SimpleImputer + RobustScaler and
+    OneHotEncoder pipelines, as built by src.model.get_preprocessor().
+
+    Returns:
+        list: Blocks of input columns, in output order.
+    """
+    if not hasattr(preprocessor, "transformers_"):
+        raise ValueError("Only ColumnTransformer preprocessors can be exported.")
+
+    blocks = []
+    for name, transformer, columns in preprocessor.transformers_:
+        out = preprocessor.output_indices_[name]
+        if transformer == "drop" or out.stop == out.start:
+            continue
+
+        steps = _steps(transformer)
+        kinds = [type(step).__name__ for step in steps]
+        key = f"block_{len(blocks)}"
+        if kinds == ["SimpleImputer", "RobustScaler"]:
+            imputer, scaler = steps
+            if np.isnan(np.asarray(imputer.statistics_, dtype=float)).any():
+                raise ValueError("Cannot export imputer with empty features.")
+            n_columns = len(columns)
+            arrays[f"{key}_statistics"] = np.asarray(imputer.statistics_, dtype=float)
+            arrays[f"{key}_center"] = (
+                scaler.center_ if scaler.with_centering else np.zeros(n_columns))
+            arrays[f"{key}_scale"] = (
+                scaler.scale_ if scaler.with_scaling else np.ones(n_columns))
+            blocks.append({"type": "num", "columns": list(columns),
+                           "start": out.start, "key": key})
+        elif kinds == ["OneHotEncoder"]:
+            encoder = steps[0]
+            if encoder.drop is not None or getattr(
+                    encoder, "_infrequent_enabled", False):
+                raise ValueError("Cannot export OneHotEncoder with drop or infrequent.")
+            categories = []
+            for values in encoder.categories_:
+                categories.append([
+                    None if _is_missing(value) else str(value) for value in values
+                ])
+            blocks.append({"type": "cat", "columns": list(columns),
+                           "start": out.start, "categories": categories,
+                           "handle_unknown": encoder.handle_unknown})
+        else:
+            raise ValueError(f"Cannot export transformer {name}: {kinds}")
+
+    return blocks
+
+
+def export_estimator(model, arrays: dict) -> dict:
+    """
+    Export a GradientBoostingRegressor (trees packed into flat arrays) or a
+    linear model (coefficients).
+
+    Returns:
+        dict: Description of the estimator.
+    """
+    if type(model).__name__ == "GradientBoostingRegressor":
+        trees = [estimator.tree_ for estimator in model.estimators_[:, 0]]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees])[:-1]
+
+        # Children indices are shifted by the offset of their tree, leaves stay -1.
+        children_left = [np.where(tree.children_left >= 0, tree.children_left + offset, -1)
+                         for tree, offset in zip(trees, offsets)]
+        children_right = [np.where(tree.children_right >= 0, tree.children_right + offset, -1)
+                          for tree, offset in zip(trees, offsets)]
+
+        arrays["tree_roots"] = offsets.astype(np.int64)
+        arrays["tree_children_left"] = np.concatenate(children_left).astype(np.int64)
+        arrays["tree_children_right"] = np.concatenate(children_right).astype(np.int64)
+        arrays["tree_feature"] = np.concatenate([t.feature for t in trees]).astype(np.int64)
+        arrays["tree_threshold"] = np.concatenate([t.threshold for t in trees])
+        arrays["tree_value"] = np.concatenate([t.value[:, 0, 0] for t in trees])
+
+        init = 0.0
+        if model.init_ != "zero":
+            init = float(np.ravel(model.init_.constant_)[0])
+
+        return {
+            "type": "gradient_boosting",
+            "init": init,
+            "learning_rate": float(model.learning_rate),
+            "max_depth": int(max(tree.max_depth for tree in trees)),
+        }
+
+    if hasattr(model, "coef_") and hasattr(model, "intercept_"):
+        arrays["coef"] = np.ravel(model.coef_).astype(float)
+        return {
+            "type": "linear",
+            "intercept": float(np.ravel(model.intercept_)[0]),
+        }
+
+    raise ValueError(f"Cannot export model: {type(model).__name__}")
+
+
+def export_model(model, preprocessor, file_path: str):
+    """
+    Export a preprocessor and a model into a single .npz file.
+
+    Raises:
+        ValueError: If the preprocessor or model cannot be exported.
+    """
+    arrays = {}
+    spec = {
+        "format": EXPORT_FORMAT,
+        "features_out": len(preprocessor.get_feature_names_out()),
+        "blocks": export_preprocessor(preprocessor, arrays),
+        "estimator": export_estimator(model, arrays),
+    }
+    arrays["spec"] = np.array(json.dumps(spec))
+
+    # np.savez adds the extension if missing, so write to a .tmp.npz file.
+    tmp_path = file_path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, file_path)
+
+    return file_path
+
+
+def normalize_metadata(metadata: dict) -> dict:
+    """
+    Convert pandas objects of older metadata into plain values, so that
+    metadata can be loaded without pandas.
+    """
+    defaults = {}
+    for col, value in metadata["feature_defaults"].items():
+        if hasattr(value, "iloc"):
+            value = value.iloc[0] if len(value) else np.nan
+        defaults[col] = value.item() if isinstance(value, np.generic) else value
+
+    categories = {
+        col: np.asarray([str(value) for value in values if not _is_missing(value)],
+                        dtype=object)
+        for col, values in metadata["feature_categories"].items()
+    }
+
+    return {**metadata, "feature_defaults": defaults, "feature_categories": categories}
+
+
+def main():
+    """Main method of this module"""
+    parser = argparse.ArgumentParser(
+        description="Export saved models for the NumPy-only API runtime.")
+    parser.add_argument("versions", nargs="+", help="Model versions (ex: v1 v2).")
+    args = parser.parse_args()
+
+    for version in args.versions:
+        model_folder_path = get_model_folder_path(version)
+        model, preprocessor, metadata = load_model(version)
+        with saving(model_folder_path):
+            export_model(model, preprocessor, os.path.join(model_folder_path, EXPORT_FILE))
+            dump_atomic(normalize_metadata(metadata),
+                        os.path.join(model_folder_path, "metadata.pkl"))
+        print(f"📦 Model exported: {model_folder_path}")
+
+
+if __name__ == "__main__":
+    main()
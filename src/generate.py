@@ -0,0 +1,284 @@
+"""Synthetic data module for the AISRM project.
+
+This module generates fake CRM files with the same layout as the public
+sales_pipeline dataset, so the data pipeline and the model can be tested
+at a much larger scale than the original files.
+"""
+
+import argparse
+import csv
+import os
+import random
+import unicodedata
+from datetime import date, timedelta
+
+from src.config import RAW_DATA_PATH
+
+SECTORS = [
+    "technolgy", "medical", "retail", "software", "entertainment",
+    "marketing", "finance", "telecommunications", "services", "employment",
+]
+OFFICE_LOCATIONS = [
+    "United States", "Philipines", "Japan", "Italy", "Norway", "Korea",
+    "Jordan", "Brazil", "Germany", "Kenya", "Panama", "Belgium", "Poland",
+    "China", "Romania",
+]
+REGIONAL_OFFICES = ["Central", "East", "West"]
+SERIES = ["GTX", "MG", "GTK"]
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ra", "te", "no", "su", "vi", "da", "ne",
+    "or", "el", "an", "bu", "zo", "fi", "ga", "ho", "ju", "pe",
+]
+ACCENTS = {
+    "a": "áàâä", "e": "éèêë", "i": "íîï", "o": "óôö", "u": "úûü", "n": "ñ",
+}
+
+START_DATE = date(2016, 10, 20)
+END_DATE = date(2017, 12, 31)
+
+CHUNK_SIZE = 10_000
+
+
+def _strip_accents(value):
+    """Helper method to compare names the way the data pipeline will."""
+    normalized = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in normalized if not unicodedata.combining(c)).lower()
+
+
+def _accentuate(rng, value, accent_rate):
+    """Randomly replace letters with an accented variant."""
+    return "".join(
+        rng.choice(ACCENTS[c]) if c in ACCENTS and rng.random() < accent_rate else c
+        for c in value
+    )
+
+
+def _unique_names(rng, count, words, accent_rate):
+    """
+    Build a list of unique, title-cased names made of random syllables.
+
+    Uniqueness is checked without accents, since the data pipeline removes
+    them and two names would otherwise collapse into the same category.
+    """
+    names = []
+    seen = set()
+    length = 2
+    while len(names) < count:
+        # Grow names when the syllable space gets crowded.
+        for _ in range(count * 4):
+            parts = [
+                "".join(rng.choice(SYLLABLES) for _ in range(length))
+                for _ in range(words)
+            ]
+            name = _accentuate(rng, " ".join(parts), accent_rate).title()
+            key = _strip_accents(name)
+            if key not in seen:
+                seen.add(key)
+                names.append(name)
+                if len(names) == count:
+                    break
+        length += 1
+
+    return names
+
+
+def _write_csv(file_path, header, rows):
+    """Write rows to a CSV file, chunk by chunk, without keeping them in memory."""
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= CHUNK_SIZE:
+                writer.writerows(chunk)
+                chunk.clear()
+        writer.writerows(chunk)
+
+    return file_path
+
+
+def generate_accounts(rng, accounts, accent_rate):
+    """Generate rows for accounts.csv."""
+    names = _unique_names(rng, accounts, 2, accent_rate)
+    for i, name in enumerate(names):
+        subsidiary_of = ""
+        if i > 0 and rng.random() < 0.2:
+            subsidiary_of = names[rng.randrange(i)]
+        yield [
+            name,
+            rng.choice(SECTORS),
+            rng.randint(1979, 2017),
+            round(rng.uniform(4.5, 11700.0), 2),
+            rng.randint(9, 35000),
+            rng.choice(OFFICE_LOCATIONS),
+            subsidiary_of,
+        ]
+
+
+def generate_products(rng, products, accent_rate):
+    """Generate rows for products.csv."""
+    names = _unique_names(rng, products, 1, accent_rate)
+    for name in names:
+        yield [name, rng.choice(SERIES), rng.randint(50, 27000)]
+
+
+def generate_sales_teams(rng, agents, accent_rate):
+    """Generate rows for sales_teams.csv, with one manager per 5 agents."""
+    names = _unique_names(rng, agents, 2, accent_rate)
+    managers = _unique_names(rng, max(1, agents // 5), 2, accent_rate)
+    offices = {manager: rng.choice(REGIONAL_OFFICES) for manager in managers}
+    for i, name in enumerate(names):
+        manager = managers[i % len(managers)]
+        yield [name, manager, offices[manager]]
+
+
+def generate_sales_pipeline(rng, rows, agents, products, accounts, prices,
+                            null_rates):
+    """
+    Generate rows for sales_pipeline.csv.
+
+    Null rates are conditional, the same way deal stages are: a deal that
+    is not engaged has no close_date, and a deal that is not closed has no
+    close_value. The overall share of missing values is therefore higher
+    than the rate of each column, except for engage_date.
+
+    Params:
+        null_rates: Rates of missing values keyed by column name, for
+            engage_date among all deals, close_date among engaged deals
+            and close_value among closed deals.
+    """
+    days = (END_DATE - START_DATE).days
+    for i in range(rows):
+        product = rng.choice(products)
+        engage_date = ""
+        close_date = ""
+        close_value = ""
+        deal_stage = "Prospecting"
+
+        if rng.random() >= null_rates["engage_date"]:
+            deal_stage = "Engaging"
+            engaged = START_DATE + timedelta(days=rng.randrange(days))
+            engage_date = engaged.isoformat()
+
+            if rng.random() >= null_rates["close_date"]:
+                deal_stage = rng.choice(["Won", "Lost"])
+                closed = engaged + timedelta(days=rng.randint(1, 138))
+                close_date = closed.isoformat()
+
+                if rng.random() >= null_rates["close_value"]:
+                    close_value = 0
+                    if deal_stage == "Won":
+                        close_value = int(prices[product] * rng.uniform(0.8, 1.1))
+
+        yield [
+            f"{i:08X}",
+            rng.choice(agents),
+            product,
+            rng.choice(accounts),
+            deal_stage,
+            engage_date,
+            close_date,
+            close_value,
+        ]
+
+
+def generate(output_path=RAW_DATA_PATH, rows=8800, agents=35, accounts=85,
+             products=7, engage_date_null_rate=0.05, close_date_null_rate=0.15,
+             close_value_null_rate=0.0, accent_rate=0.05, seed=42):
+    """
+    Generate the 4 raw CSV files expected by the data pipeline.
+
+    Default values roughly match the size of the public dataset. Null
+    rates are conditional, see generate_sales_pipeline().
+
+    Returns:
+        list: Paths of the generated files.
+    """
+    rng = random.Random(seed)
+    os.makedirs(output_path, exist_ok=True)
+
+    # Dimension tables are small enough to be kept in memory.
+    account_rows = list(generate_accounts(rng, accounts, accent_rate))
+    product_rows = list(generate_products(rng, products, accent_rate))
+    team_rows = list(generate_sales_teams(rng, agents, accent_rate))
+
+    null_rates = {
+        "engage_date": engage_date_null_rate,
+        "close_date": close_date_null_rate,
+        "close_value": close_value_null_rate,
+    }
+
+    files = [
+        _write_csv(
+            os.path.join(output_path, "accounts.csv"),
+            ["account", "sector", "year_established", "revenue", "employees",
+             "office_location", "subsidiary_of"],
+            account_rows,
+        ),
+        _write_csv(
+            os.path.join(output_path, "products.csv"),
+            ["product", "series", "sales_price"],
+            product_rows,
+        ),
+        _write_csv(
+            os.path.join(output_path, "sales_teams.csv"),
+            ["sales_agent", "manager", "regional_office"],
+            team_rows,
+        ),
+        _write_csv(
+            os.path.join(output_path, "sales_pipeline.csv"),
+            ["opportunity_id", "sales_agent", "product", "account", "deal_stage",
+             "engage_date", "close_date", "close_value"],
+            generate_sales_pipeline(
+                rng,
+                rows,
+                agents=[row[0] for row in team_rows],
+                products=[row[0] for row in product_rows],
+                accounts=[row[0] for row in account_rows],
+                prices={row[0]: row[2] for row in product_rows},
+                null_rates=null_rates,
+            ),
+        ),
+    ]
+
+    return files
+
+
+def main():
+    """Main method of this module"""
+    parser = argparse.ArgumentParser(description="Generate synthetic CRM data.")
+    parser.add_argument("--output", default=RAW_DATA_PATH)
+    parser.add_argument("--rows", type=int, default=8800)
+    parser.add_argument("--agents", type=int, default=35)
+    parser.add_argument("--accounts", type=int, default=85)
+    parser.add_argument("--products", type=int, default=7)
+    parser.add_argument("--engage-date-null-rate", type=float, default=0.05,
+                        help="Share of deals without engage_date.")
+    parser.add_argument("--close-date-null-rate", type=float, default=0.15,
+                        help="Share of engaged deals without close_date.")
+    parser.add_argument("--close-value-null-rate", type=float, default=0.0,
+                        help="Share of closed deals without close_value.")
+    parser.add_argument("--accent-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    files = generate(
+        output_path=args.output,
+        rows=args.rows,
+        agents=args.agents,
+        accounts=args.accounts,
+        products=args.products,
+        engage_date_null_rate=args.engage_date_null_rate,
+        close_date_null_rate=args.close_date_null_rate,
+        close_value_null_rate=args.close_value_null_rate,
+        accent_rate=args.accent_rate,
+        seed=args.seed,
+    )
+    for file_path in files:
+        print(f"🧪 Synthetic file generated: {file_path}")
+
+
+if __name__ == "__main__":
+    main()
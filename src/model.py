@@ -3,19 +3,45 @@
 This module contains definitions or functions related to model training.
 """
 
-import sys
+import argparse
 from datetime import datetime
-from pickle import dump, HIGHEST_PROTOCOL
+from pickle import load
 import os
 import numpy as np
 import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import SGDRegressor
 from sklearn.model_selection import train_test_split, cross_validate
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import RobustScaler, OneHotEncoder
 from src.config import PROCESSED_DATA_PATH, MODELS_PATH, HOLD_OUT
+from src.config import (
+    VALIDATION_FRACTION,
+    EARLY_STOPPING_STEP,
+    EARLY_STOPPING_PATIENCE,
+    EARLY_STOPPING_TOL,
+    MAX_ESTIMATORS,
+    CHECKPOINTS_PATH,
+    PROFILE_SIZE,
+    TRAINING_CHUNK_SIZE,
+    TRAINING_MEMORY_BUDGET_MB,
+)
+from src.export import export_model, EXPORT_FILE
+from src.storage import dump_atomic, get_model_folder_path, load_model, saving
+from src.stream import (
+    read_dataset_chunks,
+    profile_dataset,
+    get_vocabularies,
+    get_profile_metadata,
+    allocate,
+    reservoir_update,
+    drop_key,
+)
+
+# Share of the training sample used to compare accuracy and memory usage.
+SAMPLE_FRACTIONS = [0.25, 0.5, 1.0]
 
 
 def load_dataset() -> pd.DataFrame:
@@ -64,7 +90,36 @@ def split_dataset(df: pd.DataFrame, target_column: str) -> list:
     return train_test_split(X, y, test_size=HOLD_OUT)
 
 
-def get_preprocessor(num_columns: list, cat_columns: list) -> ColumnTransformer:
+def split_dataset_by_seed(df: pd.DataFrame, target_column: str,
+                          split_seed: int) -> list:
+    """
+    Deterministic train test split, from a hash of each row and a seed.
+
+    The same seed always puts a row in the same set, even when new rows are
+    added, so that resumed and warm-started fits never validate or test on
+    rows that earlier stages were fitted on.
+
+    Returns:
+        list: X_train, X_test, y_train, y_test, and the mask of validation
+            rows in the train set.
+    """
+    feature_columns = [col for col in df.columns if col != target_column]
+
+    X = df[feature_columns]  # pylint: disable=invalid-name
+    y = df[target_column]
+
+    # Uniform position of each row in [0, 1), which depends on the seed.
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    positions = pd.util.hash_array(hashes ^ np.uint64(split_seed)) / 2.0 ** 64
+
+    is_test = positions < HOLD_OUT
+    is_val = positions[~is_test] < HOLD_OUT + (1 - HOLD_OUT) * VALIDATION_FRACTION
+
+    return X[~is_test], X[is_test], y[~is_test], y[is_test], is_val
+
+
+def get_preprocessor(num_columns: list, cat_columns: list,
+                     categories="auto") -> ColumnTransformer:
 
     num_pipeline = Pipeline(
         [
@@ -75,7 +130,7 @@ def get_preprocessor(num_columns: list, cat_columns: list) -> ColumnTransformer:
 
     cat_pipeline = Pipeline(
         [
-            ("encoder", OneHotEncoder(sparse_output=False)),
+            ("encoder", OneHotEncoder(categories=categories, sparse_output=False)),
         ]
     )
 
@@ -96,6 +151,13 @@ def initialize_model() -> GradientBoostingRegressor:
     return GradientBoostingRegressor()
 
 
+def initialize_partial_model() -> SGDRegressor:
+    """
+    Get the estimator class for chunked training (supports partial_fit).
+    """
+    return SGDRegressor()
+
+
 def save_model(model, preprocessor, metadata, version: str) -> str:
     timestamp = str(datetime.now().timestamp()).split('.', maxsplit=1)[0]
     model_folder_path = f"{MODELS_PATH}/{version}"
@@ -103,71 +165,253 @@ def save_model(model, preprocessor, metadata, version: str) -> str:
         model_folder_path = f"{MODELS_PATH}/dev-{timestamp}"
         os.mkdir(model_folder_path)
 
-    with open(model_folder_path + "/model.pkl", "wb") as f:
-        dump(model, f, protocol=HIGHEST_PROTOCOL)
-    with open(model_folder_path + "/preprocessor.pkl", "wb") as f:
-        dump(preprocessor, f, protocol=HIGHEST_PROTOCOL)
-    with open(model_folder_path + "/metadata.pkl", "wb") as f:
-        dump(metadata, f, protocol=HIGHEST_PROTOCOL)
+    # The API skips the folder until all files are written.
+    with saving(model_folder_path):
+        # NumPy-only copy of the model, for a faster API startup.
+        export_path = f"{model_folder_path}/{EXPORT_FILE}"
+        try:
+            export_model(model, preprocessor, export_path)
+        except ValueError as e:
+            print(f"Model not exported, the API will load pickles: {e}")
+            if os.path.exists(export_path):
+                os.remove(export_path)
+
+        # Write to temporary files first, so files are never partial either.
+        dump_atomic(model, model_folder_path + "/model.pkl")
+        dump_atomic(preprocessor, model_folder_path + "/preprocessor.pkl")
+        dump_atomic(metadata, model_folder_path + "/metadata.pkl")
 
     return model_folder_path
 
 
+def load_previous_model(version: str, features_columns, split_seed: int):
+    """
+    Load the latest saved model of a version, if its feature schema and
+    split are the same.
+
+    Returns:
+        tuple: Model and preprocessor, or (None, None).
+    """
+    try:
+        model, preprocessor, metadata = load_model(version)
+    except (OSError, ValueError, ImportError, AttributeError) as e:
+        # No previous model, or pickled with another version of sklearn.
+        print(f"No warm start: {e}")
+        return None, None
+
+    if not isinstance(model, GradientBoostingRegressor):
+        return None, None
+    if list(preprocessor.get_feature_names_out()) != list(features_columns):
+        return None, None
+    if metadata.get("training", {}).get("split_seed") != split_seed:
+        # Validation rows may have been used to fit the previous model.
+        print("No warm start: the previous model was trained on another split.")
+        return None, None
+
+    return model, preprocessor
+
+
+def load_checkpoint(checkpoint_path: str):
+    """
+    Load an interrupted early stopping fit, if any.
+
+    Returns:
+        dict: Model, preprocessor and early stopping state, or None.
+    """
+    if not os.path.exists(checkpoint_path):
+        return None
+
+    with open(checkpoint_path, "rb") as f:
+        checkpoint = load(f)
+
+    # Checkpoints without a split cannot be resumed without leaking rows.
+    if checkpoint["state"].get("split_seed") is None:
+        return None
+
+    return checkpoint
+
+
+def load_split_seed(version: str, checkpoint: dict = None) -> int:
+    """
+    Seed of the split to reuse: the one of an interrupted fit, else the one
+    of the previous early stopping fit of this version, else a new one.
+    """
+    if checkpoint is not None:
+        return checkpoint["state"]["split_seed"]
+
+    try:
+        metadata_path = os.path.join(get_model_folder_path(version), "metadata.pkl")
+        with open(metadata_path, "rb") as f:
+            split_seed = load(f).get("training", {}).get("split_seed")
+    except (OSError, ValueError, ImportError, AttributeError):
+        split_seed = None
+
+    if split_seed is None:
+        split_seed = int(np.random.default_rng().integers(2 ** 32))
+
+    return split_seed
+
+
+def fit_early_stopping(model, preprocessor, X_train, y_train, X_val, y_val,
+                       checkpoint_path: str, state: dict = None,
+                       split_seed: int = None):
+    """
+    Fit a boosting model a few stages at a time, until the validation score
+    stops improving.
+
+    The model is checkpointed after each step so that an interrupted fit can
+    be resumed with its state, on the same split. Stages added after the
+    best validation score are dropped at the end.
+
+    Params:
+        split_seed: Seed of the train/validation split, see
+            split_dataset_by_seed(). Saved in the checkpoint.
+
+    Returns:
+        dict: Early stopping summary, saved in metadata.
+    """
+    if state is None:
+        state = {"best_score": -np.inf, "best_n": 0, "stale": 0, "scores": [],
+                 "split_seed": split_seed}
+        if hasattr(model, "n_estimators_"):
+            # Warm start: new stages must beat the previous model, on rows
+            # it was not fitted on.
+            state["best_score"] = model.score(X_val, y_val)
+            state["best_n"] = model.n_estimators_
+
+    model.set_params(warm_start=True)
+    n_estimators = getattr(model, "n_estimators_", 0)
+
+    while n_estimators < MAX_ESTIMATORS and state["stale"] < EARLY_STOPPING_PATIENCE:
+        n_estimators = min(n_estimators + EARLY_STOPPING_STEP, MAX_ESTIMATORS)
+        model.set_params(n_estimators=n_estimators)
+        model.fit(X_train, y_train)
+
+        score = model.score(X_val, y_val)
+        state["scores"].append((n_estimators, score))
+        if score > state["best_score"] + EARLY_STOPPING_TOL:
+            state.update(best_score=score, best_n=n_estimators, stale=0)
+        else:
+            state["stale"] += 1
+        print(f"Estimators: {n_estimators}, validation score: {score:.4f}")
+
+        dump_atomic({
+            "model": model,
+            "preprocessor": preprocessor,
+            "state": state,
+        }, checkpoint_path)
+
+    # Keep only the best stages, the same way sklearn's own early stopping does.
+    best_n = state["best_n"]
+    model.estimators_ = model.estimators_[:best_n]
+    model.train_score_ = model.train_score_[:best_n]
+    if hasattr(model, "oob_improvement_"):
+        model.oob_improvement_ = model.oob_improvement_[:best_n]
+    model.n_estimators_ = best_n
+    model.set_params(n_estimators=best_n, warm_start=False)
+
+    return {
+        "n_estimators": best_n,
+        "validation_score": state["best_score"],
+        "validation_scores": state["scores"],
+    }
+
+
+def get_feature_index(preprocessor, n_features_out: int):
+    """
+    Map each transformed column to the position of its original feature.
+
+    Uses the fitted ColumnTransformer itself (output slices and one-hot
+    categories) instead of parsing feature names.
+
+    Returns:
+        tuple: List of original feature names, array of their positions.
+    """
+    if not hasattr(preprocessor, 'transformers_'):
+        names = [f"feature_{i}" for i in range(n_features_out)]
+        return names, np.arange(n_features_out)
+
+    names = []
+    index = np.empty(n_features_out, dtype=np.intp)
+    for name, transformer, columns in preprocessor.transformers_:
+        out = preprocessor.output_indices_[name]
+        if out.stop == out.start:
+            continue
+
+        # One-hot encoders output one column per category.
+        encoder = transformer[-1] if isinstance(transformer, Pipeline) else transformer
+        counts = [1] * len(columns)
+        if hasattr(encoder, 'categories_'):
+            counts = [len(categories) for categories in encoder.categories_]
+        if sum(counts) != out.stop - out.start:
+            raise ValueError(f"Cannot map {name} outputs to its features.")
+
+        positions = np.arange(len(names), len(names) + len(columns))
+        index[out] = np.repeat(positions, counts)
+        names.extend(columns)
+
+    return names, index
+
+
 def get_feature_importance(model, preprocessor):
     """Get feature importance from the trained model, aggregated by original features."""
     if not hasattr(model, 'feature_importances_'):
         return None
 
-    # Get feature names after preprocessing
-    if hasattr(preprocessor, 'get_feature_names_out'):
-        transformed_feature_names = preprocessor.get_feature_names_out()
-    else:
-        transformed_feature_names = [f"feature_{i}" for i in range(
-            len(model.feature_importances_))]
+    importances = model.feature_importances_
+    names, index = get_feature_index(preprocessor, len(importances))
 
-    # Create mapping from transformed features to original features
-    original_importance = {}
-    
-    for i, transformed_name in enumerate(transformed_feature_names):
-        # Get raw importance and format as percentage
-        importance = model.feature_importances_[i] * 100
-        
-        # Extract original feature name from transformed name
-        # OneHotEncoder creates names like 'cat_transformer__feature_name_category'
-        # RobustScaler creates names like 'num_transformer__feature_name'
-        if '__' in transformed_name:
-            parts = transformed_name.split('__')
-            if len(parts) >= 2:
-                original_feature = parts[1]
-                # For one-hot encoded features, remove the category suffix
-                if '_' in original_feature and parts[0] == 'cat_transformer':
-                    original_feature = '_'.join(original_feature.split('_')[:-1])
-            else:
-                original_feature = transformed_name
-        else:
-            original_feature = transformed_name
-            
-        # Aggregate importance by original feature
-        if original_feature in original_importance:
-            original_importance[original_feature] += importance
-        else:
-            original_importance[original_feature] = importance
+    # Sum importances of transformed columns by original feature, as percentage.
+    original_importance = np.bincount(
+        index, weights=importances, minlength=len(names)) * 100
 
     # Create DataFrame and sort by importance
-    importance_df = pd.DataFrame([
-        {'feature': feature, 'importance': importance}
-        for feature, importance in original_importance.items()
-    ]).sort_values('importance', ascending=False)
+    importance_df = pd.DataFrame({
+        'feature': names,
+        'importance': original_importance,
+    }).sort_values('importance', ascending=False)
 
     return importance_df.to_dict()
 
 
-def train_and_save(version: str):
+def get_feature_metadata(features_df: pd.DataFrame, numerical_columns: list,
+                         textual_columns: list):
+    """
+    Compute default values and known categories of features.
+
+    Numbers default to their mean. Other columns are factorized once, which
+    gives both their categories and their most frequent value. Ties are
+    broken by the smallest value, same as pandas.Series.mode().
+
+    Returns:
+        tuple: Dictionaries of feature defaults and feature categories.
+    """
+    feature_defaults = features_df[numerical_columns].mean().to_dict()
+    feature_categories = {}
+
+    for col in features_df.columns.difference(numerical_columns, sort=False):
+        codes, uniques = features_df[col].factorize()
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        feature_defaults[col] = (
+            uniques[counts == counts.max()].min() if len(uniques) else np.nan)
+        if col in textual_columns:
+            feature_categories[col] = np.asarray(uniques, dtype=object)
+
+    # Keep columns order.
+    feature_defaults = {col: feature_defaults[col] for col in features_df.columns}
+
+    return feature_defaults, feature_categories
+
+
+def train_and_save(version: str, early_stopping: bool = False):
     """
     Train a model for a given version, then save it with Pickle.
     
     Params:
         version: A given version name, used for conditional logic in cleaning.
+        early_stopping: If True, add boosting stages until a validation
+            split stops improving, starting from the previous model of this
+            version when its features are the same.
     """
     # Load
     df = load_dataset()
@@ -179,7 +423,17 @@ def train_and_save(version: str):
 
     # Split
     target_column = get_target_column(df)
-    X_train, X_test, y_train, y_test = split_dataset(df, target_column)
+    if not early_stopping:
+        X_train, X_test, y_train, y_test = split_dataset(df, target_column)
+    else:
+        # Reuse the split of an interrupted fit or of the previous model.
+        os.makedirs(CHECKPOINTS_PATH, exist_ok=True)
+        checkpoint_path = os.path.join(CHECKPOINTS_PATH, f"{version}.pkl")
+        checkpoint = load_checkpoint(checkpoint_path)
+        split_seed = load_split_seed(version, checkpoint)
+        X_train, X_test, y_train, y_test, is_val = split_dataset_by_seed(
+            df, target_column, split_seed)
+        print(f"Split seed: {split_seed}")
     print(f"Train set: {1 - HOLD_OUT} = {X_train.shape[0]}")
     print(f"Test set: {HOLD_OUT} = {X_test.shape[0]}")
     print(f"Y train mean ({target_column}): {y_train.mean()}")
@@ -209,7 +463,37 @@ def train_and_save(version: str):
 
     # Fit
     model = initialize_model()
-    model.fit(X_train_transformed, y_train)
+    training = {"early_stopping": early_stopping}
+    if not early_stopping:
+        model.fit(X_train_transformed, y_train)
+    else:
+        # Resume an interrupted fit, or warm start from the previous model.
+        previous_model, previous_preprocessor, state = None, None, None
+        if checkpoint is not None and list(
+                checkpoint["preprocessor"].get_feature_names_out()) == list(features_columns):
+            previous_model = checkpoint["model"]
+            previous_preprocessor = checkpoint["preprocessor"]
+            state = checkpoint["state"]
+            print(f"Resume from checkpoint: {previous_model.n_estimators_} estimators")
+        else:
+            previous_model, previous_preprocessor = load_previous_model(
+                version, features_columns, split_seed)
+            if previous_model is not None:
+                print(f"Warm start: {previous_model.n_estimators_} estimators")
+
+        training["warm_start"] = previous_model is not None
+        if previous_model is not None:
+            # Old stages were fitted on inputs of the previous preprocessor.
+            model, preprocessor = previous_model, previous_preprocessor
+            X_train_transformed = preprocessor.transform(X_train)
+            X_test_transformed = preprocessor.transform(X_test)
+
+        training["split_seed"] = split_seed
+        training.update(fit_early_stopping(
+            model, preprocessor,
+            X_train_transformed[~is_val], y_train[~is_val],
+            X_train_transformed[is_val], y_train[is_val],
+            checkpoint_path, state, split_seed))
 
     # Score
     # @todo Save results
@@ -218,37 +502,177 @@ def train_and_save(version: str):
 
     # Metadata
     feature_importances = get_feature_importance(model, preprocessor)
-    feature_defaults = {}
-    for col in features_df.columns:
-        # Most frequent values for categories.
-        feature_defaults[col] = features_df[col].mode()
-        if col in numerical_columns:
-            # Mean values for numbers.
-            feature_defaults[col] = features_df[col].mean()
-
-    feature_categories = {}
-    for col in textual_columns:
-        feature_categories[col] = features_df[col].unique()
+    feature_defaults, feature_categories = get_feature_metadata(
+        features_df, numerical_columns, textual_columns)
 
     metadata = {
-        "model_type": str(model).replace("()", ""),
+        "model_type": type(model).__name__,
         "test_score": test_score,
         "features_out": len(features_columns),
         "feature_importances": feature_importances,
         "feature_defaults": feature_defaults,
         "feature_categories": feature_categories,
+        "training": training,
     }
 
     # Export
     model_folder_path = save_model(model, preprocessor, metadata, version)
+    if early_stopping and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
 
     print(f"Score: {test_score.mean():.4f} (+/- {test_score.std() * 2:.4f})")
     print(f"Model saved: {model_folder_path}")
 
 
-if __name__ == "__main__":
-    version = 'v2'
-    if len(sys.argv) > 1:
-        version = sys.argv[1]
+def train_and_save_out_of_core(version: str,
+                               memory_budget_mb: float = TRAINING_MEMORY_BUDGET_MB,
+                               partial_fit: bool = False,
+                               stratify: str = "sales_agent"):
+    """
+    Train a model without loading the whole dataset, then save it with Pickle.
+
+    A first streaming pass fits the preprocessor (vocabularies, robust
+    statistics) and counts rows by stratum. A second pass either keeps a
+    stratified reservoir sample sized from the memory budget, or trains a
+    partial_fit estimator chunk by chunk.
+
+    Params:
+        version: A given version name, used for conditional logic in cleaning.
+        memory_budget_mb: Memory available for the training sample.
+        partial_fit: If True, train a linear model on every chunk instead.
+        stratify: Column whose values must all be represented in samples.
+    """
+    rng = np.random.default_rng()
+
+    def chunks():
+        for chunk in read_dataset_chunks(TRAINING_CHUNK_SIZE):
+            yield clean_dataset(chunk, version)
+
+    # Streaming pass
+    profile = profile_dataset(chunks(), PROFILE_SIZE, rng, stratify,
+                              max_bytes=memory_budget_mb * 2**20)
+    target_column = profile["target_column"]
+    feature_columns = [col for col in profile["columns"] if col != target_column]
+    print(f"Streamed dataset: {profile['rows']} rows")
+
+    # Preprocess
+    preprocessor = get_preprocessor(
+        num_columns=profile["numerical_columns"],
+        cat_columns=profile["textual_columns"],
+        categories=get_vocabularies(profile),
+    )
+    preprocessor.fit(profile.pop("sample")[feature_columns])
+    features_columns = preprocessor.get_feature_names_out()
+    print(f"Features out: {len(features_columns)}")
 
-    train_and_save(version)
+    # Raw rows, dense float64 features and the float32 copy made by trees.
+    row_bytes = profile["row_bytes"] + len(features_columns) * (8 + 4)
+    sample_size = min(profile["rows"], int(memory_budget_mb * 2**20 / row_bytes))
+    train_allocation = allocate(
+        profile["strata_counts"], int(sample_size * (1 - HOLD_OUT)))
+    test_allocation = allocate(profile["strata_counts"], int(sample_size * HOLD_OUT))
+    if not partial_fit:
+        print(f"Sample size: {sample_size} rows ({memory_budget_mb} MB)")
+
+    # Sample or fit chunk by chunk
+    model = initialize_partial_model() if partial_fit else initialize_model()
+    train_sample = test_sample = None
+    rows_fitted = 0
+    for chunk in chunks():
+        is_test = rng.random(len(chunk)) < HOLD_OUT
+        test_sample = reservoir_update(test_sample, chunk[is_test], rng,
+                                       allocation=test_allocation, stratify=stratify)
+        train_chunk = chunk[~is_test]
+        if partial_fit and len(train_chunk):
+            model.partial_fit(preprocessor.transform(train_chunk[feature_columns]),
+                              train_chunk[target_column])
+            rows_fitted += len(train_chunk)
+        elif not partial_fit:
+            train_sample = reservoir_update(train_sample, train_chunk, rng,
+                                            allocation=train_allocation,
+                                            stratify=stratify)
+
+    test_sample = drop_key(test_sample)
+    X_test_transformed = preprocessor.transform(test_sample[feature_columns])
+    y_test = test_sample[target_column]
+    print(f"Test set: {len(test_sample)}")
+
+    # Accuracy versus memory
+    tradeoffs = []
+    if partial_fit:
+        tradeoffs.append({
+            "rows": rows_fitted,
+            "memory_mb": TRAINING_CHUNK_SIZE * row_bytes / 2**20,
+            "score": model.score(X_test_transformed, y_test),
+        })
+    else:
+        train_sample = drop_key(train_sample)
+        rows_fitted = len(train_sample)
+        X_train_transformed = preprocessor.transform(train_sample[feature_columns])
+        y_train = train_sample[target_column]
+        print(f"Train set: {len(train_sample)}")
+
+        # Reservoir rows are in random order, so any prefix is a random sample.
+        for fraction in SAMPLE_FRACTIONS:
+            rows = max(1, int(len(train_sample) * fraction))
+            candidate = model if fraction == 1.0 else initialize_model()
+            candidate.fit(X_train_transformed[:rows], y_train.iloc[:rows])
+            tradeoffs.append({
+                "rows": rows,
+                "memory_mb": rows * row_bytes / 2**20,
+                "score": candidate.score(X_test_transformed, y_test),
+            })
+            print(f"Rows: {rows}, score: {tradeoffs[-1]['score']:.4f}")
+
+    # Score
+    cv_results = cross_validate(model, X_test_transformed, y_test, cv=5)
+    test_score = cv_results["test_score"]
+
+    # Metadata
+    feature_importances = get_feature_importance(model, preprocessor)
+    feature_defaults, feature_categories = get_profile_metadata(profile)
+
+    metadata = {
+        "model_type": type(model).__name__,
+        "test_score": test_score,
+        "features_out": len(features_columns),
+        "feature_importances": feature_importances,
+        "feature_defaults": {col: feature_defaults[col] for col in feature_columns},
+        "feature_categories": feature_categories,
+        "training": {
+            "out_of_core": True,
+            "partial_fit": partial_fit,
+            "memory_budget_mb": memory_budget_mb,
+            "rows_total": profile["rows"],
+            "rows_sampled": rows_fitted,
+            "tradeoffs": tradeoffs,
+        },
+    }
+
+    # Export
+    model_folder_path = save_model(model, preprocessor, metadata, version)
+
+    print(f"Score: {test_score.mean():.4f} (+/- {test_score.std() * 2:.4f})")
+    print(f"Model saved: {model_folder_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train and save a model.")
+    parser.add_argument("version", nargs="?", default="v2")
+    parser.add_argument("--early-stopping", action="store_true",
+                        help="Stop boosting when the validation score plateaus.")
+    parser.add_argument("--out-of-core", action="store_true",
+                        help="Stream the dataset instead of loading it at once.")
+    parser.add_argument("--memory-budget", type=float,
+                        default=TRAINING_MEMORY_BUDGET_MB,
+                        help="Memory for the training sample, in MB (out-of-core).")
+    parser.add_argument("--partial-fit", action="store_true",
+                        help="Train on every chunk with partial_fit (out-of-core).")
+    args = parser.parse_args()
+
+    if args.out_of_core:
+        train_and_save_out_of_core(args.version,
+                                   memory_budget_mb=args.memory_budget,
+                                   partial_fit=args.partial_fit)
+    else:
+        train_and_save(args.version, early_stopping=args.early_stopping)
@@ -0,0 +1,209 @@
+"""Bulk scoring module for the AISRM project.
+
+This module scores a whole dataset offline with a saved model version,
+without going through the API.
+"""
+
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.storage import get_model_folder_path, load_model_folder
+
+CHUNK_SIZE = 50_000
+ROW_COLUMN = "row"
+PREDICTION_COLUMN = "prediction"
+
+# Loaded once per worker process, see _init_worker().
+_MODEL = None
+
+
+def _default_value(value):
+    """Metadata stores the mode of categories as a Series, keep its first value."""
+    if isinstance(value, pd.Series):
+        return value.iloc[0] if not value.empty else np.nan
+    return value
+
+
+def _init_worker(model_folder_path: str):
+    """Load the model in each worker process, only once."""
+    global _MODEL  # pylint: disable=global-statement
+    _MODEL = load_model_folder(model_folder_path)
+
+
+def read_chunks(input_path: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Read a CSV or Parquet file chunk by chunk.
+    """
+    if input_path.endswith(".parquet"):
+        # pyarrow is only required for columnar files.
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        parquet_file = pq.ParquetFile(input_path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(input_path, chunksize=chunk_size)
+
+
+def score_chunk(chunk: pd.DataFrame, start: int, all_agents: bool = False,
+                keep_columns: list = None) -> pd.DataFrame:
+    """
+    Score every row of a chunk in a single vectorized call.
+
+    Only the input row number, kept columns, sales_agent (when crossing)
+    and prediction are returned, to keep results small.
+
+    Params:
+        start: Row number of the first row of the chunk, in the input file.
+        all_agents: If True, score every row for every known sales_agent.
+        keep_columns: Input columns to copy to the output.
+    """
+    model, preprocessor, metadata = _MODEL
+
+    chunk = chunk.reset_index(drop=True)
+    chunk[ROW_COLUMN] = np.arange(start, start + len(chunk))
+    output_columns = [ROW_COLUMN] + list(keep_columns or [])
+
+    if all_agents:
+        agents = np.asarray(metadata['feature_categories']['sales_agent'])
+        chunk = chunk.loc[chunk.index.repeat(len(agents))].reset_index(drop=True)
+        chunk['sales_agent'] = np.tile(agents, len(chunk) // len(agents))
+        output_columns.append('sales_agent')
+
+    # Fill missing features with defaults, same as the API does.
+    features = chunk.copy()
+    for col, value in metadata['feature_defaults'].items():
+        if col not in features.columns:
+            features[col] = _default_value(value)
+        else:
+            features[col] = features[col].fillna(_default_value(value))
+
+    if hasattr(preprocessor, 'feature_names_in_'):
+        features = features[list(preprocessor.feature_names_in_)]
+
+    X_transformed = preprocessor.transform(features)
+    output = chunk[output_columns].copy()
+    output[PREDICTION_COLUMN] = model.predict(X_transformed)
+
+    return output
+
+
+def _write_chunk(chunk: pd.DataFrame, output_path: str, writer):
+    """
+    Append a scored chunk to the output file.
+
+    Returns:
+        The Parquet writer, if any, to be reused for the next chunks.
+    """
+    if output_path.endswith(".parquet"):
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(output_path, table.schema)
+        writer.write_table(table)
+        return writer
+
+    chunk.to_csv(output_path, mode="a", header=writer is None, index=False)
+    return True
+
+
+def get_keep_columns(keep_columns: list, all_agents: bool = False) -> list:
+    """
+    Input columns to copy to the output, without duplicates nor the columns
+    added by scoring (row, prediction, and sales_agent when crossing).
+    """
+    added = {ROW_COLUMN, PREDICTION_COLUMN}
+    if all_agents:
+        added.add('sales_agent')
+
+    return [col for col in dict.fromkeys(keep_columns or []) if col not in added]
+
+
+def score(version: str, input_path: str, output_path: str,
+          all_agents: bool = False, chunk_size: int = CHUNK_SIZE,
+          workers: int = None, keep_columns: list = None) -> int:
+    """
+    Score an entire file with a given model version.
+
+    Chunks are scored in parallel but written in their original order,
+    with at most 2 pending chunks per worker to keep memory bounded. When
+    crossing rows with agents, input chunks are shrunk so that crossed
+    chunks stay around chunk_size rows.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        ValueError: If a column to keep is not in the input file.
+    """
+    workers = workers or os.cpu_count() or 1
+    keep_columns = get_keep_columns(keep_columns, all_agents)
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    # Resolve "dev" once, so that all workers load the same model.
+    model_folder_path = get_model_folder_path(version)
+    if all_agents:
+        _, _, metadata = load_model_folder(model_folder_path)
+        agents = metadata['feature_categories']['sales_agent']
+        chunk_size = max(1, chunk_size // max(len(agents), 1))
+
+    rows = 0
+    start = 0
+    writer = None
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(model_folder_path,)) as executor:
+        for chunk in read_chunks(input_path, chunk_size):
+            missing = [col for col in keep_columns if col not in chunk.columns]
+            if missing:
+                raise ValueError(f"Columns to keep not found in {input_path}: {missing}")
+            pending.append(executor.submit(
+                score_chunk, chunk, start, all_agents, keep_columns))
+            start += len(chunk)
+            if len(pending) >= workers * 2:
+                scored = pending.popleft().result()
+                writer = _write_chunk(scored, output_path, writer)
+                rows += len(scored)
+
+        while pending:
+            scored = pending.popleft().result()
+            writer = _write_chunk(scored, output_path, writer)
+            rows += len(scored)
+
+    if hasattr(writer, 'close'):
+        writer.close()
+
+    return rows
+
+
+def main():
+    """Main method of this module"""
+    parser = argparse.ArgumentParser(description="Score a dataset offline.")
+    parser.add_argument("version", help="Model version (ex: v2, dev).")
+    parser.add_argument("input", help="Input .csv or .parquet file.")
+    parser.add_argument("output", help="Output .csv or .parquet file.")
+    parser.add_argument("--all-agents", action="store_true",
+                        help="Score every row for every sales_agent.")
+    parser.add_argument("--keep", nargs="*", default=[],
+                        help="Input columns to copy to the output.")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="Rows scored at once, after crossing with agents.")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rows = score(args.version, args.input, args.output,
+                 all_agents=args.all_agents, chunk_size=args.chunk_size,
+                 workers=args.workers, keep_columns=args.keep)
+    print(f"🎯 {rows} predictions exported: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Model storage module for the AISRM project.
+
+This module reads and writes saved model versions, for training, export
+and offline scoring.
+"""
+
+import os
+from contextlib import contextmanager
+from pickle import dump, load, HIGHEST_PROTOCOL
+
+from api.runtime import SAVING_FILE
+from src.config import MODELS_PATH
+
+
+def dump_atomic(obj, file_path: str):
+    """Pickle an object through a temporary file, so it is never left partial."""
+    with open(file_path + ".tmp", "wb") as f:
+        dump(obj, f, protocol=HIGHEST_PROTOCOL)
+    os.replace(file_path + ".tmp", file_path)
+
+
+@contextmanager
+def saving(model_folder_path: str):
+    """
+    Mark a model folder as being saved, so that the API does not load a mix
+    of old and new files. The mark is left if saving fails.
+    """
+    marker_path = os.path.join(model_folder_path, SAVING_FILE)
+    with open(marker_path, "w", encoding="utf-8"):
+        pass
+    yield model_folder_path
+    os.remove(marker_path)
+
+
+def get_model_folder_path(version: str) -> str:
+    """
+    Get the folder of a given model version, same as the API does.
+    """
+    # Load model from versioned folder (ex: ../models/v1).
+    if version != 'dev':
+        return os.path.join(MODELS_PATH, version)
+
+    # Get latest trained model by timestamp, for development purpose.
+    model_dirs = [d for d in os.listdir(MODELS_PATH)
+                  if d.startswith("dev-") and d[4:].isdigit()
+                  and os.path.isdir(os.path.join(MODELS_PATH, d))]
+
+    latest_model_dir = max(model_dirs, key=lambda d: int(d.split("-", 1)[1]))
+    return os.path.join(MODELS_PATH, latest_model_dir)
+
+
+def load_model(version: str):
+    """
+    Load the model, preprocessor and metadata saved for a given version.
+    """
+    return load_model_folder(get_model_folder_path(version))
+
+
+def load_model_folder(model_folder_path: str):
+    """
+    Load the model, preprocessor and metadata saved in a given folder.
+    """
+    with open(os.path.join(model_folder_path, "model.pkl"), "rb") as f:
+        model = load(f)
+    with open(os.path.join(model_folder_path, "preprocessor.pkl"), "rb") as f:
+        preprocessor = load(f)
+    with open(os.path.join(model_folder_path, "metadata.pkl"), "rb") as f:
+        metadata = load(f)
+
+    return model, preprocessor, metadata
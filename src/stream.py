@@ -0,0 +1,178 @@
+"""Streaming data module for the AISRM project.
+
+This module reads the processed dataset chunk by chunk, profiles it in a
+single pass and draws stratified reservoir samples, so that training does
+not need the whole dataset in memory.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.config import PROCESSED_DATA_PATH, TRAINING_CHUNK_SIZE
+
+KEY_COLUMN = "_key"
+
+
+def read_dataset_chunks(chunk_size: int = TRAINING_CHUNK_SIZE):
+    """
+    Read the processed dataset chunk by chunk.
+    """
+    yield from pd.read_csv(PROCESSED_DATA_PATH + "/dataset.csv", chunksize=chunk_size)
+
+
+def get_strata(df: pd.DataFrame, stratify: str) -> pd.Series:
+    """Stratum of each row, missing values being a stratum of their own."""
+    if stratify is None or stratify not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[stratify].astype(str)
+
+
+def allocate(counts: pd.Series, size: int) -> pd.Series:
+    """
+    Split a sample size between strata, proportionally to their counts,
+    with at least 1 row per stratum.
+    """
+    total = counts.sum()
+    if total == 0:
+        return counts
+    allocation = np.maximum(1, np.floor(counts / total * size)).astype(int)
+    return np.minimum(allocation, counts)
+
+
+def reservoir_update(sample: pd.DataFrame, chunk: pd.DataFrame, rng,
+                     allocation=None, size: int = None, stratify: str = None):
+    """
+    Add a chunk to a reservoir sample, keeping it uniformly random.
+
+    Each row gets a random key and the reservoir keeps the rows with the
+    smallest keys: overall (size) or per stratum (allocation).
+    """
+    chunk = chunk.assign(**{KEY_COLUMN: rng.random(len(chunk))})
+    merged = pd.concat([sample, chunk], ignore_index=True) if sample is not None else chunk
+    merged = merged.sort_values(KEY_COLUMN, kind="stable")
+
+    if allocation is None:
+        return merged.head(size)
+
+    strata = get_strata(merged, stratify)
+    limits = strata.map(allocation).fillna(0).to_numpy()
+    keep = merged.groupby(strata, sort=False).cumcount().to_numpy() < limits
+    return merged[keep]
+
+
+def drop_key(sample: pd.DataFrame) -> pd.DataFrame:
+    """Remove reservoir keys from a sample."""
+    if sample is None:
+        return None
+    return sample.drop(columns=[KEY_COLUMN]).reset_index(drop=True)
+
+
+def profile_dataset(chunks, profile_size: int, rng, stratify: str = None,
+                    max_bytes: float = None) -> dict:
+    """
+    Collect everything needed before training, in a single pass:
+    vocabularies, means and most frequent values of features, strata
+    counts, average row size and a uniform sample to fit robust statistics.
+
+    Assumes the target is the last column.
+
+    Params:
+        profile_size: Maximum number of rows in the sample.
+        max_bytes: Maximum memory of the sample, estimated from the average
+            size of rows read so far.
+    """
+    profile = None
+    sample = None
+    sums = counts = None
+    values = {}
+    strata_counts = pd.Series(dtype=int)
+
+    for chunk in chunks:
+        if profile is None:
+            target_column = chunk.columns[-1]
+            features = chunk.drop(columns=[target_column])
+            numerical_columns = features.select_dtypes(
+                include=[np.number]).columns.tolist()
+            textual_columns = [
+                col for col in features.columns if col not in numerical_columns]
+            profile = {
+                "columns": chunk.columns.tolist(),
+                "target_column": target_column,
+                "numerical_columns": numerical_columns,
+                "textual_columns": textual_columns,
+                "rows": 0,
+                "bytes": 0,
+            }
+            sums = pd.Series(0.0, index=numerical_columns)
+            counts = pd.Series(0, index=numerical_columns)
+            values = {col: pd.Series(dtype=int) for col in textual_columns}
+
+        features = chunk.drop(columns=[profile["target_column"]])
+
+        numbers = features[profile["numerical_columns"]].apply(
+            pd.to_numeric, errors="coerce")
+        sums = sums.add(numbers.sum(), fill_value=0)
+        counts = counts.add(numbers.count(), fill_value=0)
+        for col in profile["textual_columns"]:
+            values[col] = values[col].add(
+                features[col].value_counts(dropna=False), fill_value=0)
+
+        strata_counts = strata_counts.add(
+            get_strata(chunk, stratify).value_counts(), fill_value=0)
+        profile["rows"] += len(chunk)
+        profile["bytes"] += int(chunk.memory_usage(deep=True).sum())
+
+        # Shrinking a reservoir keeps the smallest keys, it stays uniform.
+        size = profile_size
+        if max_bytes is not None:
+            row_bytes = profile["bytes"] / max(profile["rows"], 1)
+            size = max(1, min(size, int(max_bytes / row_bytes)))
+        sample = reservoir_update(sample, chunk, rng, size=size)
+
+    if profile is None:
+        raise ValueError("Dataset is empty.")
+
+    profile["row_bytes"] = profile["bytes"] / max(profile["rows"], 1)
+    profile["means"] = (sums / counts.replace(0, np.nan)).to_dict()
+    profile["value_counts"] = values
+    profile["strata_counts"] = strata_counts.astype(int)
+    profile["sample"] = drop_key(sample)
+
+    return profile
+
+
+def get_vocabularies(profile: dict) -> list:
+    """
+    Categories of each textual feature, in OneHotEncoder format: sorted,
+    with missing values last.
+    """
+    vocabularies = []
+    for col in profile["textual_columns"]:
+        categories = profile["value_counts"][col].index
+        known = sorted((value for value in categories if not pd.isna(value)), key=str)
+        if categories.hasnans:
+            known.append(np.nan)
+        vocabularies.append(known)
+    return vocabularies
+
+
+def get_profile_metadata(profile: dict):
+    """
+    Default values and known categories of features, from a dataset profile.
+
+    Returns:
+        tuple: Dictionaries of feature defaults and feature categories.
+    """
+    feature_defaults = {}
+    feature_categories = {}
+    for col in profile["columns"]:
+        if col in profile["numerical_columns"]:
+            feature_defaults[col] = profile["means"][col]
+        elif col in profile["textual_columns"]:
+            counts = profile["value_counts"][col]
+            counts = counts[counts.index.notna()]
+            feature_defaults[col] = counts.idxmax() if len(counts) else np.nan
+            feature_categories[col] = np.asarray(
+                sorted(counts.index, key=str), dtype=object)
+
+    return feature_defaults, feature_categories
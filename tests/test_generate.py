@@ -0,0 +1,45 @@
+# pylint: disable-all
+
+import csv
+import os
+import tempfile
+import unittest
+
+from src.generate import generate
+
+
+class TestGenerate(unittest.TestCase):
+    def test_generate(self):
+        with tempfile.TemporaryDirectory() as output_path:
+            files = generate(output_path, rows=500, agents=12, accounts=30,
+                             products=4, seed=1)
+            self.assertEqual(len(files), 4)
+
+            with open(os.path.join(output_path, "sales_pipeline.csv"), encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 500)
+            self.assertLessEqual(len({row["sales_agent"] for row in rows}), 12)
+
+            # Same seed, same files.
+            with tempfile.TemporaryDirectory() as other_path:
+                generate(other_path, rows=500, agents=12, accounts=30,
+                         products=4, seed=1)
+                for name in os.listdir(output_path):
+                    with open(os.path.join(output_path, name), encoding="utf-8") as a, \
+                            open(os.path.join(other_path, name), encoding="utf-8") as b:
+                        self.assertEqual(a.read(), b.read())
+
+    def test_null_rates(self):
+        # Null rates are conditional: among all, engaged and closed deals.
+        with tempfile.TemporaryDirectory() as output_path:
+            generate(output_path, rows=20000, engage_date_null_rate=0.1,
+                     close_date_null_rate=0.2, close_value_null_rate=0.3, seed=1)
+            with open(os.path.join(output_path, "sales_pipeline.csv"), encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+
+        engaged = [row for row in rows if row["engage_date"]]
+        closed = [row for row in engaged if row["close_date"]]
+        self.assertAlmostEqual(1 - len(engaged) / len(rows), 0.1, delta=0.02)
+        self.assertAlmostEqual(1 - len(closed) / len(engaged), 0.2, delta=0.02)
+        self.assertAlmostEqual(
+            sum(not row["close_value"] for row in closed) / len(closed), 0.3, delta=0.02)
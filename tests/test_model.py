@@ -0,0 +1,108 @@
+# pylint: disable-all
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor
+
+from src.model import (
+    get_preprocessor,
+    get_feature_importance,
+    get_feature_metadata,
+    split_dataset_by_seed,
+    fit_early_stopping,
+    load_checkpoint,
+)
+
+
+class TestModel(unittest.TestCase):
+    def test_feature_importance(self):
+        # Category values with underscores, which look like feature names once one-hot encoded.
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            "revenue": rng.normal(size=200),
+            "sales_agent": rng.choice(["anna_lee", "bob_sales_agent", "cy"], size=200),
+            "product": rng.choice(["gtx_pro", "mg_special"], size=200),
+        })
+        y = df["revenue"] * 10 + (df["sales_agent"] == "anna_lee") * 5
+
+        preprocessor = get_preprocessor(["revenue"], ["sales_agent", "product"])
+        X = preprocessor.fit_transform(df)
+        model = GradientBoostingRegressor(n_estimators=20, random_state=0).fit(X, y)
+
+        importance = get_feature_importance(model, preprocessor)
+        features = dict(zip(importance["feature"].values(), importance["importance"].values()))
+        self.assertEqual(sorted(features), ["product", "revenue", "sales_agent"])
+        self.assertAlmostEqual(sum(features.values()), 100)
+        self.assertGreater(features["sales_agent"], features["product"])
+
+    def test_feature_metadata(self):
+        df = pd.DataFrame({
+            "revenue": [1.0, 2.0, 3.0, 6.0],
+            "product": ["mg_special", "gtx_pro", "mg_special", "gtx_pro"],
+        })
+        defaults, categories = get_feature_metadata(df, ["revenue"], ["product"])
+
+        self.assertEqual(defaults["revenue"], 3.0)
+        # Ties are broken by the smallest value, same as mode().
+        self.assertEqual(defaults["product"], df["product"].mode()[0])
+        self.assertEqual(sorted(categories["product"]), ["gtx_pro", "mg_special"])
+
+    def test_split_dataset_by_seed(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"revenue": rng.normal(size=1000),
+                           "close_value": rng.normal(size=1000)})
+
+        X_train, X_test, y_train, y_test, is_val = split_dataset_by_seed(df, "close_value", 7)
+        self.assertEqual(len(X_train) + len(X_test), len(df))
+        self.assertEqual(len(is_val), len(X_train))
+
+        # Same seed, same rows in each set, whatever the order or new rows.
+        more = pd.concat([df, pd.DataFrame({"revenue": [9.0], "close_value": [9.0]})])
+        shuffled = more.sample(frac=1, random_state=1)
+        _, other_test, _, _, _ = split_dataset_by_seed(shuffled, "close_value", 7)
+        self.assertTrue(set(X_test["revenue"]) <= set(other_test["revenue"]))
+
+        _, seed_test, _, _, _ = split_dataset_by_seed(df, "close_value", 8)
+        self.assertNotEqual(set(X_test["revenue"]), set(seed_test["revenue"]))
+
+    def test_fit_early_stopping_resume(self):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 3))
+        y = X[:, 0] * 3 + rng.normal(size=300)
+        X_fit, X_val, y_fit, y_val = X[:240], X[240:], y[:240], y[240:]
+        real_fit = GradientBoostingRegressor.fit
+
+        def interrupted_fit(model, *args):
+            if model.n_estimators > 30:
+                raise RuntimeError("Interrupted")
+            return real_fit(model, *args)
+
+        with tempfile.TemporaryDirectory() as checkpoints_path, \
+                mock.patch("src.model.MAX_ESTIMATORS", 60):
+            checkpoint_path = os.path.join(checkpoints_path, "test.pkl")
+            expected = fit_early_stopping(
+                GradientBoostingRegressor(random_state=0), None,
+                X_fit, y_fit, X_val, y_val, checkpoint_path, split_seed=7)
+            os.remove(checkpoint_path)
+            self.assertGreater(len(expected["validation_scores"]), 3)
+
+            with mock.patch.object(GradientBoostingRegressor, "fit",
+                                   autospec=True, side_effect=interrupted_fit):
+                with self.assertRaises(RuntimeError):
+                    fit_early_stopping(
+                        GradientBoostingRegressor(random_state=0), None,
+                        X_fit, y_fit, X_val, y_val, checkpoint_path, split_seed=7)
+
+            checkpoint = load_checkpoint(checkpoint_path)
+            self.assertEqual(checkpoint["model"].n_estimators_, 30)
+            self.assertEqual(checkpoint["state"]["split_seed"], 7)
+
+            resumed = fit_early_stopping(
+                checkpoint["model"], None, X_fit, y_fit, X_val, y_val,
+                checkpoint_path, checkpoint["state"])
+            self.assertEqual(resumed, expected)
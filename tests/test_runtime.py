@@ -0,0 +1,63 @@
+# pylint: disable-all
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDRegressor
+
+from api.runtime import NumpyModel, EXPORT_FILE
+from src.export import export_model
+from src.generate import generate
+from src.model import get_preprocessor, initialize_model
+
+
+class TestRuntime(unittest.TestCase):
+    def setUp(self):
+        with tempfile.TemporaryDirectory() as output_path:
+            generate(output_path, rows=600, agents=12, accounts=30, products=4, seed=3)
+            df = pd.read_csv(os.path.join(output_path, "sales_pipeline.csv"))
+
+        # Missing numeric and categorical values, also in the fitted data.
+        rng = np.random.default_rng(0)
+        self.features = pd.DataFrame({
+            "engage_day": (pd.to_datetime(df["engage_date"])
+                           - pd.Timestamp("2016-10-20")).dt.days.astype(float),
+            "sales_agent": df["sales_agent"].mask(rng.random(len(df)) < 0.1),
+            "product": df["product"].mask(rng.random(len(df)) < 0.1),
+            "account": df["account"],
+        })
+        self.target = df["close_value"].fillna(0)
+
+    def assert_same_predictions(self, model):
+        preprocessor = get_preprocessor(["engage_day"], ["sales_agent", "product", "account"])
+        X = preprocessor.fit_transform(self.features)
+        model.fit(X, self.target)
+        expected = model.predict(preprocessor.transform(self.features))
+        self.assertTrue(np.isfinite(expected).all())
+
+        with tempfile.TemporaryDirectory() as model_folder_path:
+            file_path = os.path.join(model_folder_path, EXPORT_FILE)
+            export_model(model, preprocessor, file_path)
+            runtime_model = NumpyModel(file_path)
+
+        records = self.features.to_dict("records")
+        np.testing.assert_allclose(runtime_model.predict_records(records), expected, rtol=1e-9)
+
+        # Missing values as sent by other clients.
+        for record in records:
+            if pd.isna(record["sales_agent"]):
+                record["sales_agent"] = pd.NA
+            if pd.isna(record["product"]):
+                record["product"] = None
+            if pd.isna(record["engage_day"]):
+                del record["engage_day"]
+        np.testing.assert_allclose(runtime_model.predict_records(records), expected, rtol=1e-9)
+
+    def test_gradient_boosting(self):
+        self.assert_same_predictions(initialize_model())
+
+    def test_sgd(self):
+        self.assert_same_predictions(SGDRegressor(random_state=0))
@@ -0,0 +1,86 @@
+# pylint: disable-all
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor
+
+from src.model import get_preprocessor
+from src.score import score
+from src.storage import dump_atomic
+
+
+class TestScore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.agents = ["anna", "bob", "cy"]
+        df = pd.DataFrame({
+            "id": np.arange(40),
+            "revenue": rng.normal(size=40),
+            "sales_agent": rng.choice(self.agents, size=40),
+        })
+        y = df["revenue"] * 10 + (df["sales_agent"] == "anna") * 5
+
+        self.preprocessor = get_preprocessor(["revenue"], ["sales_agent"])
+        self.preprocessor.fit(df[["revenue", "sales_agent"]])
+        self.model = GradientBoostingRegressor(n_estimators=10, random_state=0)
+        self.model.fit(self.preprocessor.transform(df[["revenue", "sales_agent"]]), y)
+        metadata = {
+            "feature_defaults": {"revenue": 0.0, "sales_agent": "anna"},
+            "feature_categories": {"sales_agent": np.asarray(self.agents, dtype=object)},
+        }
+
+        self.models_path = os.path.join(self.tmp.name, "models")
+        os.makedirs(os.path.join(self.models_path, "test"))
+        for name, obj in [("model", self.model), ("preprocessor", self.preprocessor),
+                          ("metadata", metadata)]:
+            dump_atomic(obj, os.path.join(self.models_path, "test", f"{name}.pkl"))
+
+        self.input_path = os.path.join(self.tmp.name, "input.csv")
+        df.head(7).to_csv(self.input_path, index=False)
+        self.df = df.head(7)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def score(self, output_name, **kwargs):
+        output_path = os.path.join(self.tmp.name, output_name)
+        with mock.patch("src.storage.MODELS_PATH", self.models_path):
+            rows = score("test", self.input_path, output_path, workers=1, chunk_size=3, **kwargs)
+        output = pd.read_csv(output_path)
+        self.assertEqual(rows, len(output))
+        return output
+
+    def predict(self, df):
+        return self.model.predict(self.preprocessor.transform(df[["revenue", "sales_agent"]]))
+
+    def test_score(self):
+        output = self.score("output.csv", keep_columns=["id"])
+
+        self.assertEqual(list(output.columns), ["row", "id", "prediction"])
+        np.testing.assert_array_equal(output["row"], np.arange(7))
+        np.testing.assert_array_equal(output["id"], self.df["id"])
+        np.testing.assert_allclose(output["prediction"], self.predict(self.df))
+
+    def test_score_all_agents(self):
+        output = self.score("crossed.csv", all_agents=True,
+                            keep_columns=["id", "sales_agent", "row"])
+
+        # Added columns are never duplicated.
+        self.assertEqual(list(output.columns), ["row", "id", "sales_agent", "prediction"])
+        self.assertEqual(len(output), 7 * len(self.agents))
+        np.testing.assert_array_equal(output["row"], np.repeat(np.arange(7), 3))
+        self.assertEqual(list(output["sales_agent"]), self.agents * 7)
+
+        crossed = self.df.loc[self.df.index.repeat(3)].reset_index(drop=True)
+        crossed["sales_agent"] = self.agents * 7
+        np.testing.assert_allclose(output["prediction"], self.predict(crossed))
+
+    def test_score_missing_keep_column(self):
+        with self.assertRaisesRegex(ValueError, "account"):
+            self.score("missing.csv", keep_columns=["account"])
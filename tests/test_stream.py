@@ -0,0 +1,110 @@
+# pylint: disable-all
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.stream import (
+    allocate,
+    reservoir_update,
+    drop_key,
+    profile_dataset,
+    get_vocabularies,
+)
+
+
+def make_dataset(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    agents = rng.choice(["anna", "bob", "cy", "dee"], size=rows, p=[0.6, 0.3, 0.098, 0.002])
+    agents[:2] = "dee"
+    return pd.DataFrame({
+        "revenue": np.where(rng.random(rows) < 0.1, np.nan, rng.normal(size=rows)),
+        "sales_agent": agents,
+        "product": np.where(rng.random(rows) < 0.1, None, rng.choice(["gtx", "mg"], size=rows)),
+        "close_value": rng.normal(size=rows),
+    })
+
+
+def sample(df, chunk_size, allocation=None, size=None, seed=1):
+    rng = np.random.default_rng(seed)
+    result = None
+    for start in range(0, len(df), chunk_size):
+        result = reservoir_update(result, df.iloc[start:start + chunk_size], rng,
+                                  allocation=allocation, size=size, stratify="sales_agent")
+    return drop_key(result)
+
+
+class TestStream(unittest.TestCase):
+    def test_allocate(self):
+        counts = pd.Series({"anna": 1000, "bob": 10, "cy": 1})
+        allocation = allocate(counts, 50)
+
+        self.assertTrue((allocation >= 1).all())
+        self.assertTrue((allocation <= counts).all())
+        self.assertEqual(allocation["cy"], 1)
+        self.assertLessEqual(allocation.sum(), 50 + len(counts))
+
+    def test_reservoir_update(self):
+        df = make_dataset()
+        counts = df["sales_agent"].value_counts()
+        allocation = allocate(counts, 40)
+        result = sample(df, 37, allocation=allocation)
+
+        # Every stratum is kept, up to its allocation.
+        kept = result["sales_agent"].value_counts()
+        self.assertEqual(set(kept.index), set(counts.index))
+        self.assertTrue((kept == allocation[kept.index]).all())
+
+        # Same seed, same sample, whatever the chunks.
+        pd.testing.assert_frame_equal(result, sample(df, 500, allocation=allocation))
+        pd.testing.assert_frame_equal(result, sample(df, 1, allocation=allocation))
+
+        uniform = sample(df, 37, size=30)
+        self.assertEqual(len(uniform), 30)
+        pd.testing.assert_frame_equal(uniform, sample(df, 120, size=30))
+
+    def test_profile_dataset(self):
+        df = make_dataset()
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, "dataset.csv")
+            df.to_csv(file_path, index=False)
+            full = pd.read_csv(file_path)
+
+            def profile(chunk_size, **kwargs):
+                return profile_dataset(pd.read_csv(file_path, chunksize=chunk_size), 100,
+                                       np.random.default_rng(1), "sales_agent", **kwargs)
+
+            result = profile(64)
+            other = profile(500)
+
+        self.assertEqual(result["rows"], len(full))
+        self.assertEqual(result["target_column"], "close_value")
+        self.assertEqual(result["numerical_columns"], ["revenue"])
+        self.assertAlmostEqual(result["means"]["revenue"], full["revenue"].mean())
+        pd.testing.assert_series_equal(
+            result["strata_counts"].sort_index(),
+            full["sales_agent"].value_counts().sort_index(), check_names=False)
+
+        vocabularies = get_vocabularies(result)
+        self.assertEqual(vocabularies[0], sorted(full["sales_agent"].unique()))
+        self.assertEqual(vocabularies[1][:-1], sorted(full["product"].dropna().unique()))
+        self.assertTrue(pd.isna(vocabularies[1][-1]))
+        for col in ["sales_agent", "product"]:
+            pd.testing.assert_series_equal(
+                result["value_counts"][col].astype(int).sort_index(),
+                full[col].value_counts(dropna=False).sort_index(),
+                check_names=False)
+
+        # The sample does not depend on chunks either.
+        self.assertEqual(len(result["sample"]), 100)
+        pd.testing.assert_frame_equal(result["sample"], other["sample"])
+
+    def test_profile_dataset_max_bytes(self):
+        df = make_dataset()
+        row_bytes = df.memory_usage(deep=True).sum() / len(df)
+        result = profile_dataset([df.iloc[:250], df.iloc[250:]], 100, np.random.default_rng(1),
+                                 max_bytes=row_bytes * 20)
+        self.assertLessEqual(len(result["sample"]), 25)